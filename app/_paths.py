@@ -0,0 +1,4 @@
+import os
+
+# Repository root, computed once per process for the modules that put it on sys.path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -2,11 +2,12 @@ import sys
 import os
 
 # Add project root to Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from _paths import PROJECT_ROOT
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 import threading
+import concurrent.futures
 import logging
 from multiprocessing import freeze_support
 import queue
@@ -15,6 +16,11 @@ from core import Core
 from ui.ui import UI # Changed this line
 
 
+# Sentinel put into the core/UI queues on shutdown to wake up and end their consumer threads. Both queues are
+# in-process SimpleQueues, so the very same object comes out and an identity check is enough.
+_STOP = object()
+
+
 class App:
     """
     +----------------------------------------------------+
@@ -24,7 +30,7 @@ class App:
     |    |  GUI  |                                       |
     |    +-------+                                       |
     |        ^                                           |
-    |        | (via MP Queues)                           |
+    |        | (via Queues)                              |
     |        v                                           |
     |  +-----------+  (Screenshot + Goal)  +-----------+ |
     |  |           | --------------------> |           | |
@@ -53,6 +59,17 @@ class App:
         self.core = Core()
         self.ui = UI() # Changed this line
 
+        # Reused worker threads to run user requests on, instead of a new thread per request. A superseded request
+        # gives up its thread at its next check, the second one lets the newest request start while the previous
+        # request finishes the LLM call it is blocked in.
+        self.core_request_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix='core-req'
+        )
+
+        # Last status forwarded to the UI, used to drop consecutive duplicates
+        self.last_sent_status = None
+
         # Threading event to signal thread termination
         self.stop_event = threading.Event()
 
@@ -76,45 +93,78 @@ class App:
         finally:
             # Signal threads to stop
             self.stop_event.set()
+            self.core.status_queue.put(_STOP)
+            self.ui.main_window.user_request_queue.put(_STOP)
             
             # Wait for threads to finish
             self.core_to_ui_connection_thread.join(timeout=2)
             self.ui_to_core_connection_thread.join(timeout=2)
 
     def send_status_from_core_to_ui(self) -> None:
-        while not self.stop_event.is_set():
+        while True:
             try:
-                # Use a timeout to periodically check stop_event
-                status = self.core.status_queue.get(timeout=1)
-                print(f'Sending status: {status}')
-                self.ui.display_current_status(status)
-            except queue.Empty:
-                continue
+                # Block until there is a status or the shutdown sentinel
+                status = self.core.status_queue.get()
+                if status is _STOP:
+                    return
+
+                # Drain whatever else is already queued so a burst of statuses reaches the UI in one call
+                statuses = [status]
+                stopping = False
+                while not stopping:
+                    try:
+                        status = self.core.status_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if status is _STOP:
+                        stopping = True
+                    else:
+                        statuses.append(status)
+
+                # Steps of a plan often share the same justification, only forward it once in a row
+                changed_statuses = []
+                for status in statuses:
+                    # Steps without a human_readable_justification queue None, there is nothing to show for them
+                    if status is None:
+                        continue
+                    if status is self.last_sent_status or status == self.last_sent_status:
+                        continue
+                    changed_statuses.append(status)
+                    self.last_sent_status = status
+
+                if changed_statuses:
+                    print(f'Sending statuses: {changed_statuses}')
+                    self.ui.display_current_statuses(changed_statuses)
+
+                if stopping:
+                    return
             except Exception as e:
                 print(f"Error in send_status_from_core_to_ui: {e}")
                 break
 
     def send_user_request_from_ui_to_core(self) -> None:
-        while not self.stop_event.is_set():
+        while True:
             try:
-                # Use a timeout to periodically check stop_event
-                command_obj = self.ui.main_window.user_request_queue.get(timeout=1)
+                # Block until there is a request or the shutdown sentinel
+                command_obj = self.ui.main_window.user_request_queue.get()
+                if command_obj is _STOP:
+                    return
                 
                 # If it's a stop command
-                if command_obj.get('command') == 'stop':
+                if command_obj.command == 'stop':
                     self.core.stop_previous_request()
                 else:
                     # Extract the command from the command object
-                    user_request = command_obj.get('command', '')
+                    user_request = command_obj.command
                     print(f'Sending user request: {user_request}')
+
+                    # A new request may legitimately get the same reply as the previous one
+                    self.last_sent_status = None
                     
-                    threading.Thread(
-                        target=self.core.execute_user_request, 
-                        args=(user_request,), 
-                        daemon=True
-                    ).start()
-            except queue.Empty:
-                continue
+                    # Supersede the running request now rather than when this one gets a worker, so a request
+                    # waiting for a free thread can't leave older ones recursing in the meantime
+                    generation = self.core.new_request_generation()
+                    self.core_request_executor.submit(self.core.execute_user_request, user_request, generation)
             except Exception as e:
                 print(f"Error in send_user_request_from_ui_to_core: {e}")
                 break
@@ -122,10 +172,16 @@ class App:
     def cleanup(self):
         # Signal threads to stop
         self.stop_event.set()
+        self.core.status_queue.put(_STOP)
+        self.ui.main_window.user_request_queue.put(_STOP)
         
         # Wait for threads to finish
         self.core_to_ui_connection_thread.join(timeout=2)
         self.ui_to_core_connection_thread.join(timeout=2)
+
+        # Pool threads are not daemons, so stop a running request for good to let the interpreter exit
+        self.core.shutdown()
+        self.core_request_executor.shutdown(wait=False, cancel_futures=True)
         
         # Cleanup core resources
         self.core.cleanup()
@@ -1,5 +1,5 @@
-import time
-from multiprocessing import Queue
+import threading
+from queue import SimpleQueue
 from typing import Optional, Any
 
 from openai import OpenAIError
@@ -11,8 +11,16 @@ from utils.settings import Settings
 
 class Core:
     def __init__(self):
-        self.status_queue = Queue()
-        self.interrupt_execution = False
+        # Core and UI live in the same process, so a SimpleQueue avoids the pickling and feeder thread of an MP Queue
+        self.status_queue = SimpleQueue()
+        # Bumped for every new request and every stop. A request whose generation is no longer the current one has
+        # been superseded and stops at its next LLM call or step.
+        self.generation = 0
+        self.generation_lock = threading.Lock()
+        # Whether the current generation came from a stop rather than a new request
+        self.stopped = False
+        # Set once when the app closes
+        self.shutdown_event = threading.Event()
         self.settings_dict = Settings().get_dict()
 
         self.interpreter = Interpreter(self.status_queue)
@@ -27,15 +35,30 @@ class Core:
                                   f'Error likely in file {Settings().settings_file_path}.\n'
                                   f'Error: {e}')
 
-    def execute_user_request(self, user_request: str) -> None:
-        self.stop_previous_request()
-        time.sleep(0.1)
-        self.execute(user_request)
+    def new_request_generation(self, stopped: bool = False) -> int:
+        with self.generation_lock:
+            self.generation += 1
+            self.stopped = stopped
+            return self.generation
+
+    def execute_user_request(self, user_request: str, generation: Optional[int] = None) -> None:
+        # Callers that queue the request take its generation up front, so older requests stop even while it waits
+        if generation is None:
+            generation = self.new_request_generation()
+        self.execute(user_request, generation=generation)
 
     def stop_previous_request(self) -> None:
-        self.interrupt_execution = True
+        self.new_request_generation(stopped=True)
+
+    def shutdown(self) -> None:
+        # Stop the running request for good: no further LLM calls or steps
+        self.shutdown_event.set()
+        self.new_request_generation(stopped=True)
+
+    def _should_stop(self, generation: int) -> bool:
+        return generation != self.generation or self.shutdown_event.is_set()
 
-    def execute(self, user_request: str, step_num: int = 0) -> Optional[str]:
+    def execute(self, user_request: str, step_num: int = 0, generation: Optional[int] = None) -> Optional[str]:
         """
         This function might recurse.
 
@@ -45,8 +68,13 @@ class Core:
             in the middle of one.
             Without it the LLM kept looping after finishing the user request.
             Also, it is needed because the LLM we are using doesn't have a stateful/assistant mode.
+        generation: the request generation this call belongs to, see new_request_generation().
         """
-        self.interrupt_execution = False
+        if generation is None:
+            generation = self.generation
+
+        def should_stop() -> bool:
+            return self._should_stop(generation)
 
         if not self.llm:
             status = 'Set your OpenAPI API Key in Settings and Restart the App'
@@ -58,23 +86,28 @@ class Core:
             if not isinstance(user_request, str):
                 user_request = str(user_request)
 
+            # Superseded, stopped or the app is closing: don't call the LLM again
+            if should_stop():
+                return self.interrupted()
             instructions: dict[str, Any] = self.llm.get_instructions_for_objective(user_request, step_num)
 
             if instructions == {}:
+                if should_stop():
+                    return self.interrupted()
                 # Sometimes LLM sends malformed JSON response, in that case retry once more.
                 instructions = self.llm.get_instructions_for_objective(user_request + ' Please reply in valid JSON',
                                                                        step_num)
 
-            for step in instructions['steps']:
-                if self.interrupt_execution:
-                    self.status_queue.put('Interrupted')
-                    self.interrupt_execution = False
-                    return 'Interrupted'
+            # Consecutive launches (URLs, applications, terminal commands) run alongside each other
+            if should_stop():
+                return self.interrupted()
+            success = self.interpreter.process_commands(instructions['steps'], should_stop=should_stop)
 
-                success = self.interpreter.process_command(step)
+            if should_stop():
+                return self.interrupted()
 
-                if not success:
-                    return 'Unable to execute the request'
+            if not success:
+                return 'Unable to execute the request'
 
         except Exception as e:
             status = f'Exception Unable to execute the request - {e}'
@@ -89,7 +122,14 @@ class Core:
         else:
             # if not done, continue to next phase
             self.status_queue.put('Fetching further instructions based on current state')
-            return self.execute(user_request, step_num + 1)
+            return self.execute(user_request, step_num + 1, generation)
+
+    def interrupted(self) -> str:
+        # Only report an explicit stop. A request replaced by a newer one stays quiet so its status doesn't land in
+        # the middle of the new request, and nobody is left to read statuses once the app is closing.
+        if self.stopped and not self.shutdown_event.is_set():
+            self.status_queue.put('Interrupted')
+        return 'Interrupted'
 
     def play_ding_on_completion(self):
         # Play ding sound to signal completion
@@ -97,4 +137,6 @@ class Core:
             print('\a')
 
     def cleanup(self):
-        self.llm.cleanup()
+        self.interpreter.cleanup()
+        if self.llm:
+            self.llm.cleanup()
@@ -1,12 +1,19 @@
 import json
 import os
 import logging
-from multiprocessing import Queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import SimpleQueue
 from time import sleep
-from typing import Any
+from functools import partial
+from typing import Any, Callable
 import webbrowser
+import shlex
 import subprocess
 
+from utils.settings import Settings
+
+logger = logging.getLogger(__name__)
+
 try:
     import pyautogui
 except Exception as e:
@@ -14,30 +21,106 @@ except Exception as e:
     logging.warning("Running in headless mode. Some GUI automation features will be disabled.")
     pyautogui = None
 
+# Functions that need a display to drive the mouse or keyboard, skipped in headless mode
+_GUI_FUNCTIONS = frozenset({'click', 'moveTo', 'typewrite', 'write', 'press', 'hotkey'})
+
+# Browser names offered in Settings -> names of their webbrowser controllers
+_BROWSER_MAP = {'Chrome': 'chrome', 'Firefox': 'firefox', 'Safari': 'safari', 'Edge': 'edge'}
+
+# Functions that only launch something outside the app, consecutive ones can run alongside each other
+_PARALLEL_FUNCTIONS = frozenset({'open_url', 'open_application', 'run_terminal_command'})
+
+
 class Interpreter:
-    def __init__(self, status_queue: Queue):
-        # MP Queue to put current status of execution in while processes commands.
+    def __init__(self, status_queue: SimpleQueue):
+        # Queue to put current status of execution in while processes commands.
         # It helps us reflect the current status on the UI.
         self.status_queue = status_queue
         
         # Check and warn about GUI automation capabilities
         if pyautogui is None:
-            logging.warning("WARNING: GUI automation is not available. Some functionality will be limited.")
+            logger.warning("WARNING: GUI automation is not available. Some functionality will be limited.")
             self.headless_mode = True
         else:
             self.headless_mode = False
 
-    def process_commands(self, json_commands: list[dict[str, Any]]) -> bool:
+        # pyautogui only needs its warm-up key press once per session, see execute_function()
+        self._warmed_up = False
+
+        # Browser used by open_url_in_browser(), resolved from settings again only when the settings file changes
+        self._settings_mtime = None
+        self.reload_settings()
+
+        # Workers for _PARALLEL_FUNCTIONS in process_commands(), statuses still report back through status_queue
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='interpreter')
+
+        # Function name -> handler taking the command's parameters, built once instead of resolved per command
+        self._dispatch = self._build_dispatch_table()
+
+    def reload_settings(self) -> None:
+        """
+        Re-reads the settings the interpreter caches. open_url_in_browser() calls it when the settings file has been
+        modified since the last read.
+        """
+        settings = Settings()
+        self._settings_path = settings.settings_file_path
+        self._settings_mtime = self._get_settings_mtime()
+        default_browser = settings.get_dict().get('default_browser', 'Default')
+
+        self._browser_ctrl = webbrowser
+        if default_browser in _BROWSER_MAP:
+            try:
+                self._browser_ctrl = webbrowser.get(_BROWSER_MAP[default_browser])
+            except webbrowser.Error as e:
+                logger.warning('Could not find browser %s, using the system default: %s', default_browser, e)
+
+    def _get_settings_mtime(self):
+        try:
+            return os.stat(self._settings_path).st_mtime_ns
+        except OSError:
+            # No settings file yet
+            return None
+
+    def process_commands(self, json_commands: list[dict[str, Any]],
+                         should_stop: Callable[[], bool] = lambda: False) -> bool:
         """
         Reads a list of JSON commands and runs the corresponding function call as specified in context.txt
         :param json_commands: List of JSON Objects with format as described in context.txt
-        :return: True for successful execution, False for exception while interpreting or executing.
+        :param should_stop: Checked before each command; when it returns True no further commands are started
+        :return: True for successful execution, False for exception while interpreting or executing, or when stopped.
         """
+        # Bound once instead of looked up on self for every command
+        process_command = self.process_command
+        submit = self._pool.submit
+        wait_for_commands = self._wait_for_commands
+
+        pending = []
         for command in json_commands:
-            success = self.process_command(command)
-            if not success:
+            if should_stop():
+                return False  # Launches already started finish on their own
+
+            if command.get('function') in _PARALLEL_FUNCTIONS:
+                pending.append(submit(process_command, command))
+                continue
+
+            # Everything else drives the mouse/keyboard or waits, so it has to see the launches above finished
+            if pending:
+                if not wait_for_commands(pending):
+                    return False  # End early and return
+                pending = []
+
+            if not process_command(command):
                 return False  # End early and return
-        return True
+        return wait_for_commands(pending)
+
+    def cleanup(self) -> None:
+        # Don't start queued launches after shutdown; running ones finish on their own
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _wait_for_commands(futures: list[Future]) -> bool:
+        results = [future.result() for future in futures]
+        return all(results)
 
     def process_command(self, json_command: dict[str, Any]) -> bool:
         """
@@ -47,24 +130,28 @@ class Interpreter:
         :return: True for successful execution, False for exception while interpreting or executing.
         """
         function_name = json_command['function']
+
+        # Comprehensive handling for headless mode, checked first so skipped steps don't cost a status queue put
+        if self.headless_mode and function_name in _GUI_FUNCTIONS:
+            logger.warning('Skipping GUI function %s in headless mode.', function_name)
+            return True # Simulate action without executing for headless mode
+
         parameters = json_command.get('parameters', {})
         human_readable_justification = json_command.get('human_readable_justification')
-        print(f'Now performing - {function_name} - {parameters} - {human_readable_justification}')
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Now performing - %s - %s - %s', function_name, parameters, human_readable_justification)
         self.status_queue.put(human_readable_justification)
         
-        # Comprehensive handling for headless mode
-        gui_functions = ['click', 'moveTo', 'typewrite', 'write', 'press', 'hotkey']
-        if self.headless_mode and function_name in gui_functions:
-            logging.warning(f"Skipping GUI function {function_name} in headless mode.")
-            return True # Simulate action without executing for headless mode
-        
         try:
             self.execute_function(function_name, parameters)
             return True
         except Exception as e:
             self.status_queue.put(f'We are having a problem executing this step - {type(e)} - {e}')
-            self.status_queue.put(f'This was the json we received from the LLM: {json.dumps(json_command, indent=2)}')
-            self.status_queue.put(f'This is what we extracted:\n         function_name:{function_name}\n         parameters:{parameters}')
+            if logger.isEnabledFor(logging.ERROR):
+                # The traceback is attached by logger.exception, the JSON dump is only built if it will be emitted
+                logger.exception('This was the json we received from the LLM: %s\n'
+                                 'This is what we extracted:\n         function_name:%s\n         parameters:%s',
+                                 json.dumps(json_command, indent=2), function_name, parameters)
             return False
 
     def execute_function(self, function_name: str, parameters: dict[str, Any]) -> None:
@@ -74,48 +161,85 @@ class Interpreter:
             2. pyautogui calls to interact with system's mouse and keyboard.
         """
         # Sometimes pyautogui needs warming up i.e. sometimes first call isn't executed hence padding a random call here
-        if pyautogui is not None:
+        if pyautogui is not None and not self._warmed_up:
             pyautogui.press("command", interval=0.2)
+            self._warmed_up = True
+
+        handler = self._dispatch.get(function_name)
+        if handler is None:
+            logger.warning('No such function %s in our interface\'s interpreter', function_name)
+            return
+
+        handler(parameters)
+
+    def _build_dispatch_table(self) -> dict[str, Callable[[dict[str, Any]], None]]:
+        dispatch = {}
+
+        if pyautogui is not None:
+            # Keyboard and Mouse commands i.e. any public pyautogui function, parameters are passed as they are
+            for name in dir(pyautogui):
+                function_to_call = getattr(pyautogui, name)
+                if not name.startswith('_') and callable(function_to_call):
+                    dispatch[name] = partial(self._call_with_parameters, function_to_call)
+
+            # pyautogui functions where the LLM sometimes gets confused on the parameter names
+            dispatch['write'] = self._write
+            dispatch['press'] = self._press
+            dispatch['hotkey'] = self._hotkey
+
+        dispatch.update({
+            'sleep': self._sleep,
+            'open_url': lambda parameters: self.open_url_in_browser(parameters.get('url')),
+            'open_application': lambda parameters: self.open_application(parameters.get('name')),
+            'run_terminal_command': lambda parameters: self.run_terminal_command(parameters.get('command')),
+        })
+
+        return dispatch
 
-        if function_name == "sleep":
-            secs = parameters.get("secs")
-            if secs:
-                sleep(secs)
-        elif function_name == "open_url":
-            url = parameters.get("url")
-            self.open_url_in_browser(url)
-        elif function_name == "open_application":
-             app_name = parameters.get("name")
-             self.open_application(app_name)
-        elif function_name == "run_terminal_command":
-            command = parameters.get("command")
-            self.run_terminal_command(command)
-        elif pyautogui is not None and hasattr(pyautogui, function_name):
-            # Execute the corresponding pyautogui function i.e. Keyboard or Mouse commands.
-            function_to_call = getattr(pyautogui, function_name)
-            if function_name == 'write' and ('string' in parameters or 'text' in parameters):
-                # 'write' function expects a string, not a 'text' keyword argument but LLM sometimes gets confused on the parameter name.
-                string_to_write = parameters.get('string') or parameters.get('text')
-                interval = parameters.get('interval', 0.1)
-                function_to_call(string_to_write, interval=interval)
-            elif function_name == 'press' and ('keys' in parameters):
-                keys = parameters.get('keys', [])
-                presses = parameters.get('presses', 1)
-                interval = parameters.get('interval', 0.2)
-                for key in keys:
-                    function_to_call(key, presses=presses, interval=interval)
-            elif function_name == 'press' and ('key' in parameters): # Modified this line
-                 key = parameters.get('key') # Added this line
-                 function_to_call(key) # Modified this line
-            elif function_name == 'hotkey' and ('keys' in parameters):
-                keys = parameters.get('keys', [])
-                function_to_call(*keys)
-            else:
-                # For other functions, pass the parameters as they are
-                function_to_call(**parameters)
+    @staticmethod
+    def _call_with_parameters(function_to_call: Callable[..., Any], parameters: dict[str, Any]) -> None:
+        function_to_call(**parameters)
+
+    @staticmethod
+    def _sleep(parameters: dict[str, Any]) -> None:
+        secs = parameters.get('secs')
+        if secs:
+            sleep(secs)
+
+    @staticmethod
+    def _write(parameters: dict[str, Any]) -> None:
+        if 'string' in parameters or 'text' in parameters:
+            # 'write' function expects a string, not a 'text' keyword argument but LLM sometimes gets confused on the parameter name.
+            string_to_write = parameters.get('string') or parameters.get('text')
+            interval = parameters.get('interval', 0.1)
+            pyautogui.write(string_to_write, interval=interval)
+        else:
+            pyautogui.write(**parameters)
+
+    @staticmethod
+    def _press(parameters: dict[str, Any]) -> None:
+        if 'keys' not in parameters and 'key' not in parameters:
+            pyautogui.press(**parameters)
+            return
+
+        if 'keys' in parameters:
+            keys = parameters['keys']
+            interval = parameters.get('interval', 0.2)
+        else:
+            # A single key used to be a plain pyautogui.press(key), keep it free of any sleep
+            keys = [parameters['key']]
+            interval = parameters.get('interval', 0.0)
+        presses = parameters.get('presses', 1)
+        # pyautogui.press presses the whole sequence back to back and sleeps interval after each pass over it
+        pyautogui.press(keys, presses=presses, interval=interval)
+
+    @staticmethod
+    def _hotkey(parameters: dict[str, Any]) -> None:
+        if 'keys' in parameters:
+            pyautogui.hotkey(*parameters.get('keys', []))
         else:
-            print(f'No such function {function_name} in our interface\'s interpreter')
-    
+            pyautogui.hotkey(**parameters)
+
     def open_url_in_browser(self, url: str) -> None:
         """
         Opens the URL in the default browser.
@@ -124,23 +248,10 @@ class Interpreter:
              url (str): The URL to open.
         """
         self.status_queue.put(f'opening URL {url}')
-        
-        settings = Settings()
-        settings_dict = settings.get_dict()
-        default_browser = settings_dict.get('default_browser', 'Default')
-        
-        if default_browser == 'Default':
-            webbrowser.open(url)
-        elif default_browser == 'Chrome':
-            webbrowser.get('chrome').open(url)
-        elif default_browser == 'Firefox':
-            webbrowser.get('firefox').open(url)
-        elif default_browser == 'Safari':
-            webbrowser.get('safari').open(url)
-        elif default_browser == 'Edge':
-             webbrowser.get('edge').open(url)
-        else:
-             webbrowser.open(url)
+        # Pick up a Default Browser changed in Settings since the last URL
+        if self._get_settings_mtime() != self._settings_mtime:
+            self.reload_settings()
+        self._browser_ctrl.open(url)
 
     def open_application(self, app_name: str) -> None:
         """
@@ -151,7 +262,15 @@ class Interpreter:
         """
         self.status_queue.put(f'opening application {app_name}')
         try:
-          subprocess.Popen(app_name, shell=True) # Use shell=True so subprocess will use the shell to call the application
+            try:
+                # Exec the application directly, going through a shell costs an extra process per launch. Only plain
+                # words qualify: anything the shell would expand or interpret (~, $VAR, &&, quotes...) goes to the shell.
+                argv = shlex.split(app_name)
+                if not argv or any(shlex.quote(arg) != arg for arg in argv):
+                    raise ValueError('application name needs a shell')
+                subprocess.Popen(argv, close_fds=True, start_new_session=True)
+            except (ValueError, OSError):
+                subprocess.Popen(app_name, shell=True) # Use shell=True so subprocess will use the shell to call the application
         except Exception as e:
           self.status_queue.put(f"Error opening application '{app_name}': {e}")
 
@@ -164,6 +283,6 @@ class Interpreter:
         """
         self.status_queue.put(f'running terminal command: {command}')
         try:
-            subprocess.Popen(['/bin/bash', '-c', command])
+            subprocess.Popen(['/bin/bash', '-c', command], close_fds=True, start_new_session=True)
         except Exception as e:
            self.status_queue.put(f'Error running terminal command {command}: {e}')
\ No newline at end of file
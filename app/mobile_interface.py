@@ -1,17 +1,23 @@
-import os
+import collections
+import itertools
 import sys
 import threading
 import queue
 import gradio as gr
 
 # Add project root to Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, project_root)
+from _paths import PROJECT_ROOT
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from core import Core
 from utils.settings import Settings
 
 class MobileInterface:
+    # Exchanges kept in conversation_history, and how many of the latest ones are rendered in the Dataframe
+    HISTORY_LIMIT = 200
+    RENDERED_ROWS = 50
+
     def __init__(self, core_instance=None):
         """
         Initialize Mobile Interface with optional Core instance
@@ -25,38 +31,24 @@ class MobileInterface:
         self.input_queue = queue.Queue()
         self.output_queue = queue.Queue()
         
-        # Shared state with thread-safe mechanisms
+        # Shared state. Single dict item assignments and deque appends are atomic under the GIL, so only the
+        # compound history + current_output update in process_input and copying the history need a lock.
+        # conversation_history holds [input, output] rows, the shape the Dataframe renders.
         self.shared_state = {
-            'conversation_history': [],
+            'conversation_history': collections.deque(maxlen=self.HISTORY_LIMIT),
             'current_input': '',
             'current_output': '',
             'output_log': [],
-            'lock': threading.Lock()
         }
+        self._history_lock = threading.Lock()
 
-    def update_shared_state(self, key, value):
+    def rendered_rows(self):
         """
-        Thread-safe method to update shared state
-        
-        Args:
-            key (str): Key in shared state
-            value (any): Value to update
+        Latest RENDERED_ROWS exchanges of conversation_history, as [input, output] Dataframe rows.
         """
-        with self.shared_state['lock']:
-            self.shared_state[key] = value
-
-    def get_shared_state(self, key):
-        """
-        Thread-safe method to retrieve shared state
-        
-        Args:
-            key (str): Key in shared state
-        
-        Returns:
-            any: Value of the key
-        """
-        with self.shared_state['lock']:
-            return self.shared_state[key]
+        history = self.shared_state['conversation_history']
+        with self._history_lock:
+            return list(itertools.islice(history, max(0, len(history) - self.RENDERED_ROWS), None))
 
     def create_interface(self):
         """
@@ -65,34 +57,29 @@ class MobileInterface:
         Returns:
             gr.Blocks: Gradio interface
         """
-        def sync_input(input_text):
-            """Synchronize input across interfaces"""
-            self.update_shared_state('current_input', input_text)
-            self.input_queue.put(input_text)
-            return input_text
-
         def process_input(input_text):
             """Process input and generate response"""
             try:
+                self.input_queue.put(input_text)
+
                 # Process input using Core
                 response = self.core.generate_response(input_text)
                 
                 # Update shared state
-                with self.shared_state['lock']:
-                    self.shared_state['conversation_history'].append({
-                        'input': input_text,
-                        'output': response
-                    })
+                with self._history_lock:
+                    self.shared_state['current_input'] = input_text
+                    self.shared_state['conversation_history'].append([input_text, response])
                     self.shared_state['current_output'] = response
                 
                 # Put response in output queue
                 self.output_queue.put(response)
                 
-                return response
+                # Pushed straight to [output_textbox, conversation_history] by the click event
+                return response, self.rendered_rows()
             except Exception as e:
                 error_response = f"Error: {str(e)}"
                 self.output_queue.put(error_response)
-                return error_response
+                return error_response, self.rendered_rows()
 
         with gr.Blocks() as interface:
             with gr.Row():
@@ -100,13 +87,7 @@ class MobileInterface:
                     # Input components
                     input_textbox = gr.Textbox(
                         label="Input", 
-                        placeholder="Enter your message...",
-                        value=lambda: self.get_shared_state('current_input')
-                    )
-                    input_textbox.change(
-                        fn=sync_input, 
-                        inputs=input_textbox, 
-                        outputs=input_textbox
+                        placeholder="Enter your message..."
                     )
                     
                     submit_btn = gr.Button("Send")
@@ -115,13 +96,11 @@ class MobileInterface:
                     # Output components
                     output_textbox = gr.Textbox(
                         label="Output", 
-                        interactive=False,
-                        value=lambda: self.get_shared_state('current_output')
+                        interactive=False
                     )
                     
                     conversation_history = gr.Dataframe(
-                        headers=['Input', 'Output'],
-                        value=lambda: self.get_shared_state('conversation_history')
+                        headers=['Input', 'Output']
                     )
             
             # Bind submit button
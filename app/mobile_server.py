@@ -1,8 +1,9 @@
+import hashlib
 import os
 import sys
 import threading
-import queue
-from typing import Dict, Any, Optional, List
+from collections import deque
+from typing import Deque, Dict, Any, Optional, List, Tuple
 
 import gradio as gr
 import qrcode
@@ -14,7 +15,14 @@ sys.path.insert(0, project_root)
 from core import Core
 from utils.settings import Settings
 
+# Largest side of PNG QR codes, in pixels; the desktop UI shows them in a 400x400 popup
+QR_PNG_MAX_SIZE = 380
+
 class MobileServer:
+    # Exchanges kept in conversation_history, and how many of the latest ones are rendered in the Dataframe
+    HISTORY_LIMIT = 200
+    RENDERED_ROWS = 50
+
     def __init__(self, core_instance: Optional[Core] = None):
         """
         Initialize Mobile Server with optional Core instance.
@@ -27,18 +35,22 @@ class MobileServer:
         self.app: Optional[gr.Blocks] = None
         self.public_url: Optional[str] = None
         
-        # Thread-safe communication queues
-        self.input_queue: queue.Queue = queue.Queue()
-        self.output_queue: queue.Queue = queue.Queue()
+        # Thread-safe communication queues. Nothing blocks on them, so bounded deques (atomic append/popleft under
+        # the GIL) replace queue.Queue's lock + condition variable and keep them from growing forever.
+        self.input_queue: Deque[str] = deque(maxlen=256)
+        self.output_queue: Deque[str] = deque(maxlen=256)
         
-        # Shared state with thread-safe mechanisms
-        self.shared_state: Dict[str, Any] = {
-            'conversation_history': [],
-            'current_input': '',
-            'current_output': '',
-            'output_log': [],
-            'lock': threading.Lock()
-        }
+        # Shared state, read on every Gradio poll. Each field is only ever rebound to a new value (never mutated in
+        # place), which is atomic under the GIL, so reads need no lock. _write_lock only keeps process_input's
+        # history + current_output update consistent.
+        self.current_input: str = ''
+        self.current_output: str = ''
+        self.conversation_history: Tuple[Dict[str, str], ...] = ()
+        self.output_log: Tuple[str, ...] = ()
+        self._write_lock = threading.Lock()
+
+        # URL -> path of its generated QR code image
+        self._qr_cache: Dict[str, str] = {}
 
     def update_shared_state(self, key: str, value: Any) -> None:
         """
@@ -48,8 +60,7 @@ class MobileServer:
             key (str): Key in shared state to update
             value (Any): Value to set for the given key
         """
-        with self.shared_state['lock']:
-            self.shared_state[key] = value
+        setattr(self, key, value)
 
     def get_shared_state(self, key: str) -> Any:
         """
@@ -61,8 +72,7 @@ class MobileServer:
         Returns:
             Any: Value of the specified key
         """
-        with self.shared_state['lock']:
-            return self.shared_state[key]
+        return getattr(self, key)
 
     def create_gradio_interface(self) -> gr.Blocks:
         """
@@ -73,8 +83,9 @@ class MobileServer:
         """
         def sync_input(input_text: str) -> str:
             """Synchronize input across interfaces"""
-            self.update_shared_state('current_input', input_text)
-            self.input_queue.put(input_text)
+            # Plain rebind (atomic), then queue outside of any critical section
+            self.current_input = input_text
+            self.input_queue.append(input_text)
             return input_text
 
         def process_input(input_text: str) -> str:
@@ -88,34 +99,38 @@ class MobileServer:
                 str: Generated response or error message
             """
             try:
-                # Process input using Core
+                # Process input using Core, outside the lock
                 response = self.core.generate_response(input_text)
                 
-                # Update shared state
-                with self.shared_state['lock']:
-                    self.shared_state['conversation_history'].append({
+                # Update shared state; the lock covers only the two rebinds. The copy keeps at most HISTORY_LIMIT
+                # entries, so it doesn't grow with the session.
+                with self._write_lock:
+                    self.conversation_history = (*self.conversation_history[-(self.HISTORY_LIMIT - 1):], {
                         'input': input_text,
                         'output': response
                     })
-                    self.shared_state['current_output'] = response
+                    self.current_output = response
                 
-                # Put response in output queue
-                self.output_queue.put(response)
+                # Put response in output queue after releasing the lock
+                self.output_queue.append(response)
                 
                 return response
             except Exception as e:
                 error_response = f"Error: {str(e)}"
-                self.output_queue.put(error_response)
+                self.output_queue.append(error_response)
                 return error_response
 
+        def history_rows() -> List[List[str]]:
+            """Latest RENDERED_ROWS exchanges of the conversation history as Dataframe rows"""
+            return [[entry['input'], entry['output']] for entry in self.conversation_history[-self.RENDERED_ROWS:]]
+
         with gr.Blocks() as interface:
             with gr.Row():
                 with gr.Column():
                     # Input components
                     input_textbox = gr.Textbox(
                         label="Input", 
-                        placeholder="Enter your message...",
-                        value=lambda: self.get_shared_state('current_input')
+                        placeholder="Enter your message..."
                     )
                     input_textbox.change(
                         fn=sync_input, 
@@ -129,27 +144,29 @@ class MobileServer:
                     # Output components
                     output_textbox = gr.Textbox(
                         label="Output", 
-                        interactive=False,
-                        value=lambda: self.get_shared_state('current_output')
+                        interactive=False
                     )
                     
                     conversation_history = gr.Dataframe(
-                        headers=['Input', 'Output'],
-                        value=lambda: self.get_shared_state('conversation_history')
+                        headers=['Input', 'Output']
                     )
             
-            # Bind submit button
+            # Bind submit button. Outputs are pushed by these events (streamed over the queue) rather than
+            # re-polled through value callbacks.
             submit_btn.click(
                 fn=process_input, 
                 inputs=input_textbox, 
-                outputs=[output_textbox, conversation_history]
+                outputs=output_textbox
+            ).then(
+                fn=history_rows,
+                outputs=conversation_history
             )
 
         return interface
 
     def start(self) -> Optional[str]:
         """
-        Start or stop the Gradio server. (Simplified, no queue)
+        Start or stop the Gradio server.
 
         Returns:
             Optional[str]: Public URL for the Gradio interface, or None if failed
@@ -162,44 +179,34 @@ class MobileServer:
         # Create Gradio interface
         interface = self.create_gradio_interface()
     
-        # Find an available port
-        import socket
-        def find_free_port() -> int:
-            """Find and return a free network port"""
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('', 0))
-                s.listen(1)
-                port = s.getsockname()[1]
-            return port
-
         try:
-            # Determine port and launch configuration
-            free_port = find_free_port()
+            # Launch configuration
             gradio_kwargs = {
                 'share': True,  # Enable public sharing
                 'server_name': '0.0.0.0',  # Listen on all network interfaces
-                'server_port': free_port,  # Use dynamically found port
+                'server_port': None,  # Let Gradio bind the first free port itself, no separate probe socket
                 'prevent_thread_lock': True,  # Prevent blocking the main thread
                 'show_error': True,  # Show detailed errors
             }
             
-            # Launch without queue
+            # Queue events so results are pushed to clients over SSE and concurrent users are bounded
+            interface.queue(default_concurrency_limit=4, max_size=64, status_update_rate='auto')
             self.app, local_url, public_url = interface.launch(**gradio_kwargs)
         
             # Prefer public URL, fallback to local URL
-            self.public_url = public_url or local_url or f'http://0.0.0.0:{free_port}'
+            self.public_url = public_url or local_url or f'http://0.0.0.0:{interface.server_port}'
         
-            # Generate and save QR code
+            # Generate and save QR code, the UI's generate_qr_code call for the same URL is then a cache hit
             qr_code_path = self.generate_qr_code(self.public_url)
         
-            print(f"Gradio Mobile Interface URL (No Queue): {self.public_url}")
+            print(f"Gradio Mobile Interface URL: {self.public_url}")
             print(f"QR Code saved to: {qr_code_path}")
 
             print(f"Mobile Interface URL: {self.public_url}")
             return self.public_url
 
         except Exception as e:
-            print(f"Error starting Gradio server (No Queue): {e}")
+            print(f"Error starting Gradio server: {e}")
             import traceback
             traceback.print_exc()
             with open("server_status.txt", "w") as f:
@@ -241,6 +248,13 @@ class MobileServer:
         Returns:
             str: Path to generated QR code image
         """
+        # Reuse the image from an earlier start with the same URL
+        cached_path = self._qr_cache.get(url)
+        if cached_path and os.path.exists(cached_path):
+            return cached_path
+
+        requested_url = url
+
         # Ensure URL is valid
         if not url.startswith(('http://', 'https://')):
             url = f'https://{url}'
@@ -258,9 +272,14 @@ class MobileServer:
         # Create and save QR code image
         qr_code_dir = os.path.join(os.path.dirname(__file__), 'qr_codes')
         os.makedirs(qr_code_dir, exist_ok=True)
-        qr_code_path = os.path.join(qr_code_dir, 'mobile_interface_qr.png')
-        
+        # URL hash in the file name so the images of different URLs can coexist in the cache
+        url_hash = hashlib.blake2s(url.encode()).hexdigest()[:8]
+        qr_code_path = os.path.join(qr_code_dir, f'mobile_interface_qr_{url_hash}.png')
+
+        # Largest whole-pixel module size that fits the QR popup, so the UI shows the PNG without resizing
+        qr.box_size = max(1, QR_PNG_MAX_SIZE // (qr.modules_count + 2 * qr.border))
         qr_img = qr.make_image(fill_color="black", back_color="white")
         qr_img.save(qr_code_path)
 
+        self._qr_cache[requested_url] = qr_code_path
         return qr_code_path
@@ -1,11 +1,20 @@
+import asyncio
 import json
-import time
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from models.model import Model
+from openai import AsyncOpenAI
 from openai.types.beta.threads.message import Message
 from utils.screen import Screen
 
+# Shared decoder for pulling the instructions object out of the LLM's reply
+_JSON_DECODER = json.JSONDecoder()
+
+# Upper bound on one step's round trip (screenshot upload, run and reply), so a request never waits forever
+REQUEST_TIMEOUT_SECS = 300
 
 # TODO
 # [ ] Function calling with assistants api - https://platform.openai.com/docs/assistants/tools/function-calling/quickstart
@@ -24,12 +33,32 @@ class GPT4o(Model):
 
         self.thread = self.client.beta.threads.create()
 
+        # Per-step requests go through the async client, driven by one long-lived event loop on a background
+        # thread. Concurrent objectives share that loop and its connection pool instead of each blocking a thread.
+        self.aclient = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, name='gpt4o-event-loop', daemon=True)
+        self._loop_thread.start()
+
         # IDs of images uploaded to OpenAI for use with the assistants API, can be cleaned up once thread is no longer needed
         self.list_of_image_ids = []
 
     def get_instructions_for_objective(self, original_user_request: str, step_num: int = 0) -> dict[str, Any]:
+        # Sync facade for Core, the request itself runs on the shared event loop
+        future = asyncio.run_coroutine_threadsafe(
+            self.get_instructions_for_objective_async(original_user_request, step_num),
+            self.loop
+        )
+        try:
+            return future.result(timeout=REQUEST_TIMEOUT_SECS)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def get_instructions_for_objective_async(self, original_user_request: str,
+                                                   step_num: int = 0) -> dict[str, Any]:
         # Upload screenshot to OpenAI - Note: Don't delete files from openai while the thread is active
-        openai_screenshot_file_id = self.upload_screenshot_and_get_file_id()
+        openai_screenshot_file_id = await self.upload_screenshot_and_get_file_id()
 
         self.list_of_image_ids.append(openai_screenshot_file_id)
 
@@ -38,36 +67,34 @@ class GPT4o(Model):
                                                                   openai_screenshot_file_id)
 
         # Read response
-        llm_response = self.send_message_to_llm(formatted_user_request)
+        llm_response = await self.send_message_to_llm(formatted_user_request)
         json_instructions: dict[str, Any] = self.convert_llm_response_to_json_instructions(llm_response)
 
         return json_instructions
 
-    def send_message_to_llm(self, formatted_user_request) -> Message:
-        message = self.client.beta.threads.messages.create(
+    async def send_message_to_llm(self, formatted_user_request) -> Message:
+        message = await self.aclient.beta.threads.messages.create(
             thread_id=self.thread.id,
             role='user',
             content=formatted_user_request
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
+        # create_and_poll only returns once the run reaches a terminal status, no need to poll again ourselves
+        run = await self.aclient.beta.threads.runs.create_and_poll(
             thread_id=self.thread.id,
             assistant_id=self.assistant.id,
-            instructions=''
+            instructions='',
+            poll_interval_ms=200
         )
 
-        while run.status != 'completed':
-            print(f'Waiting for response, sleeping for 1. run.status={run.status}')
-            time.sleep(1)
-
-            if run.status == 'failed':
-                print(f'failed run run.required_action:{run.required_action} run.last_error: {run.last_error}\n\n')
-                return None
+        if run.status == 'failed':
+            print(f'failed run run.required_action:{run.required_action} run.last_error: {run.last_error}\n\n')
+            return None
 
         if run.status == 'completed':
             # NOTE: Apparently right now the API doesn't have a way to retrieve just the last message???
             #  So instead you get all messages and take the latest one
-            response = self.client.beta.threads.messages.list(
+            response = await self.aclient.beta.threads.messages.list(
                 thread_id=self.thread.id
             )
 
@@ -76,29 +103,26 @@ class GPT4o(Model):
             print('Run did not complete successfully.')
             return None
 
-    def upload_screenshot_and_get_file_id(self):
+    async def upload_screenshot_and_get_file_id(self):
         """
-        Upload screenshot to OpenAI and display in UI output log.
+        Upload screenshot to OpenAI.
         
         :return: File ID of uploaded screenshot
         """
-        # Import Screen utility and get screenshot file path
-        from utils.screen import Screen
+        # Blocking screen capture and file read happen off the event loop
+        filename, content = await asyncio.to_thread(self.read_screenshot_file)
+        return await self.upload_file(filename, content)
+
+    @staticmethod
+    def read_screenshot_file() -> tuple[str, bytes]:
         filepath = Screen().get_screenshot_file()
-        
-        # Optional: Display screenshot in UI output log if UI is available
-        try:
-            from app import App
-            if hasattr(App, 'ui') and App.ui:
-                App.ui.display_screenshot_in_output_log()
-        except Exception as display_error:
-            print(f"Could not display screenshot in output log: {display_error}")
-        
-        # Existing screenshot upload logic
+        with open(filepath, "rb") as screenshot_file:
+            return os.path.basename(filepath), screenshot_file.read()
+
+    async def upload_file(self, filename: str, content: bytes):
         try:
-            # Your existing OpenAI screenshot upload code here
-            openai_file = self.client.files.create(
-                file=open(filepath, "rb"),
+            openai_file = await self.aclient.files.create(
+                file=(filename, content),
                 purpose="vision"
             )
             return openai_file.id
@@ -134,19 +158,53 @@ class GPT4o(Model):
 
         # Our current LLM model does not guarantee a JSON response hence we manually parse the JSON part of the response
         # Check for updates here - https://platform.openai.com/docs/guides/text-generation/json-mode
+        # raw_decode parses only the first complete object, so prose with braces after it doesn't break parsing
         start_index = llm_response_data.find('{')
-        end_index = llm_response_data.rfind('}')
+        if start_index < 0:
+            print('Error while parsing JSON response - no JSON object found')
+            return {}
 
         try:
-            json_response = json.loads(llm_response_data[start_index:end_index + 1].strip())
-        except Exception as e:
+            json_response, _ = _JSON_DECODER.raw_decode(llm_response_data, start_index)
+        except ValueError as e:
             print(f'Error while parsing JSON response - {e}')
             json_response = {}
 
         return json_response
 
     def cleanup(self):
+        # Cancel requests still in flight first, so the threads waiting on them wake up instead of blocking shutdown
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_pending_tasks(), self.loop).result(timeout=5)
+        except Exception as e:
+            print(f'Error cancelling pending OpenAI requests - {e}')
+
         # Note: Cannot delete screenshots while the thread is active. Cleanup during shut down.
-        for id in self.list_of_image_ids:
-            self.client.files.delete(id)
+        # Each delete is an HTTP round trip, so overlap them instead of paying for them one after another.
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(self._safe_delete, self.list_of_image_ids))
+        self.list_of_image_ids = []
         self.thread = self.client.beta.threads.create()  # Using old thread even by accident would cause Image errors
+
+        # Close the async client's connections on its own loop, then stop and close the loop
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclient.close(), self.loop).result(timeout=5)
+        except Exception as e:
+            print(f'Error closing the async OpenAI client - {e}')
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join(timeout=5)
+        if not self._loop_thread.is_alive():
+            self.loop.close()
+
+    @staticmethod
+    async def _cancel_pending_tasks() -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _safe_delete(self, file_id) -> None:
+        try:
+            self.client.files.delete(file_id)
+        except Exception as e:
+            print(f'Error deleting uploaded screenshot {file_id} - {e}')
@@ -2,12 +2,14 @@ import logging
 import threading
 import traceback
 from datetime import datetime
-from typing import Union, Optional, Dict, Any
+from typing import TYPE_CHECKING, Union, Optional, Dict, Any
 
-import ttkbootstrap as ttk
-from PIL import Image, ImageTk
 from contextlib import contextmanager
 
+if TYPE_CHECKING:
+    # PIL is only imported when the first screenshot is shown
+    from PIL import Image
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,7 +39,7 @@ class UILoggingMixin:
     A mixin class providing advanced logging capabilities for UI components.
     """
     
-    def resize_image_thumbnail(self, image: Image.Image, max_width: int = 300) -> Image.Image:
+    def resize_image_thumbnail(self, image: 'Image.Image', max_width: int = 300) -> 'Image.Image':
         """
         Resize an image to a thumbnail while maintaining aspect ratio.
         
@@ -47,9 +49,10 @@ class UILoggingMixin:
         """
         width_percent = (max_width / float(image.size[0]))
         height_size = int((float(image.size[1]) * float(width_percent)))
+        from PIL import Image
         return image.resize((max_width, height_size), Image.LANCZOS)
     
-    def update_output_log(self, message: str, screenshot: Optional[Image.Image] = None) -> None:
+    def update_output_log(self, message: str, screenshot: Optional['Image.Image'] = None) -> None:
         """
         Update the output log with a message and optional screenshot.
         
@@ -73,6 +76,7 @@ class UILoggingMixin:
                         thumbnail = self.resize_image_thumbnail(screenshot)
                         
                         # Convert PIL Image to PhotoImage for Tkinter
+                        from PIL import ImageTk
                         photo = ImageTk.PhotoImage(thumbnail)
                         
                         # Insert the image into the text widget
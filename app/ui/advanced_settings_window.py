@@ -1,6 +1,14 @@
 import ttkbootstrap as ttk
 from ui.logging_mixin import UILoggingMixin
+from ui.main_window import MainWindow
 from utils.settings import Settings
+from ui.ui_utils import _cached_settings, _invalidate_cached_settings, set_label_text
+
+# ttkbootstrap style names for the leaf widgets. Passing style= directly skips parsing a bootstyle keyword per widget;
+# the style itself is built once per theme and shared.
+_PRIMARY_LABEL = 'primary.TLabel'
+_SECONDARY_LABEL = 'secondary.TLabel'
+_INFO_RADIO = 'info.TRadiobutton'
 
 
 class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
@@ -8,28 +16,38 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
     Self-contained settings sub-window for the UI
     """
 
+    # (radio button label, model name) for the OpenAI model choices
+    MODELS = (
+        ('GPT-4o (Default. Medium-Accurate, Medium-Fast)', 'gpt-4o'),
+        ('GPT-4o-mini (Cheapest, Fastest)', 'gpt-4o-mini'),
+        ('GPT-4v (Deprecated. Most-Accurate, Slowest)', 'gpt-4-vision-preview'),
+        ('GPT-4-Turbo (Least Accurate, Fast)', 'gpt-4-turbo')
+    )
+
+    # (settings key, widget attribute, kind): 'entry' widgets are cleared and refilled, 'radio' ones are set()
+    FIELDS = (
+        ('api_key', 'api_key_entry', 'entry'),
+        ('model', 'model_var', 'radio'),
+        ('base_url', 'base_url_entry', 'entry'),
+        ('base_model', 'base_model_entry', 'entry'),
+        ('custom_model_api_key', 'custom_model_api_key_entry', 'entry'),
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
+        # The parent is the Settings window; the model label to update lives on the main window above it
+        main_window = parent
+        while main_window is not None and not isinstance(main_window, MainWindow):
+            main_window = main_window.master
+        self._main_window = main_window
         self.title('AI Model Settings')
-
-        # Initialize settings
-        self.settings = Settings()
+        # Closing with the title bar hides the window so the next open can reuse it
+        self.protocol('WM_DELETE_WINDOW', self.hide)
 
         # Set precise window dimensions
         window_width = 370
         window_height = 820
 
-        # Set window size and minimum size
-        self.geometry(f'{window_width}x{window_height}')
-        self.minsize(window_width, window_height)
-
-        # Ensure window doesn't expand unnecessarily
-        self.grid_propagate(False)
-
-        # Position the window directly on top of the parent window
-        self.transient(parent)  # Set as a child window of the parent
-        self.grab_set()  # Make modal
-
         # Calculate parent window position and center this window
         parent_x = parent.winfo_rootx()
         parent_y = parent.winfo_rooty()
@@ -39,8 +57,21 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
         x = parent_x + (parent_width - window_width) // 2
         y = parent_y + (parent_height - window_height) // 2
 
-        self.geometry(f'+{x}+{y}')
+        # Set window size and position in one request, then minimum size
+        self.geometry(f'{window_width}x{window_height}+{x}+{y}')
+        self.minsize(window_width, window_height)
 
+        # Ensure window doesn't expand unnecessarily
+        self.grid_propagate(False)
+
+        # Position the window directly on top of the parent window
+        self.transient(parent)  # Set as a child window of the parent
+        self.grab_set()  # Make modal
+
+        # Build the widgets on the next idle tick so the window paints first
+        self.after_idle(self._build_body)
+
+    def _build_body(self) -> None:
         # Main content frame
         content_frame = ttk.Frame(self)
         content_frame.pack(fill='both', expand=True, padx=10, pady=10)
@@ -52,35 +83,31 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
         openai_frame.columnconfigure(0, weight=1)
 
         # OpenAI API Key Input
-        label_api = ttk.Label(openai_frame, text='OpenAI API Key:', bootstyle="primary")
+        label_api = ttk.Label(openai_frame, text='OpenAI API Key:', style=_PRIMARY_LABEL)
         label_api.grid(row=0, column=0, sticky='w', padx=5, pady=(10, 5))
         self.api_key_entry = ttk.Entry(openai_frame, width=50)
         self.api_key_entry.grid(row=1, column=0, sticky='ew', padx=5, pady=(0, 10))
 
         # Model Selection for OpenAI
-        ttk.Label(openai_frame, text='Select OpenAI Model:', bootstyle="primary").grid(row=2, column=0, sticky='w', padx=5,
+        ttk.Label(openai_frame, text='Select OpenAI Model:', style=_PRIMARY_LABEL).grid(row=2, column=0, sticky='w', padx=5,
                                                                                        pady=(10, 5))
 
-        # Model selection radio buttons
+        # Model selection radio buttons. model_var only drives which button is shown as selected; the chosen model
+        # is tracked in _model_value by the buttons' command so saving doesn't read the Tcl variable.
         self.model_var = ttk.StringVar(value='gpt-4o')  # default selection
-        models = [
-            ('GPT-4o (Default. Medium-Accurate, Medium-Fast)', 'gpt-4o'),
-            ('GPT-4o-mini (Cheapest, Fastest)', 'gpt-4o-mini'),
-            ('GPT-4v (Deprecated. Most-Accurate, Slowest)', 'gpt-4-vision-preview'),
-            ('GPT-4-Turbo (Least Accurate, Fast)', 'gpt-4-turbo')
-        ]
-
+        self._model_value = 'gpt-4o'
         # Create a frame to hold the radio buttons
         radio_frame = ttk.Frame(openai_frame)
         radio_frame.grid(row=3, column=0, sticky='ew', padx=5, pady=(0, 10))
 
-        for text, value in models:
+        for text, value in self.MODELS:
             ttk.Radiobutton(
                 radio_frame,
                 text=text,
                 value=value,
                 variable=self.model_var,
-                bootstyle="info"
+                command=lambda v=value: setattr(self, '_model_value', v),
+                style=_INFO_RADIO
             ).pack(anchor=ttk.W, pady=5)
 
         # Save Button for OpenAI Settings
@@ -98,7 +125,7 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
         custom_model_frame.columnconfigure(0, weight=1)
 
         # Custom Model Selection
-        ttk.Label(custom_model_frame, text='Custom Model:', bootstyle="primary").grid(row=0, column=0, sticky='w', padx=5,
+        ttk.Label(custom_model_frame, text='Custom Model:', style=_PRIMARY_LABEL).grid(row=0, column=0, sticky='w', padx=5,
                                                                                      pady=(10, 5))
         self.custom_model_var = ttk.StringVar(value='custom')
         ttk.Radiobutton(
@@ -106,26 +133,22 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
             text='Enable Custom Model',
             value='custom',
             variable=self.custom_model_var,
-            bootstyle="info"
+            style=_INFO_RADIO
         ).grid(row=1, column=0, sticky='w', padx=5, pady=(0, 10))
 
-        # Custom Base URL Input
-        label_base_url = ttk.Label(custom_model_frame, text='Custom Base URL:', bootstyle="secondary")
-        label_base_url.grid(row=2, column=0, sticky='w', padx=5, pady=(10, 5))
-        self.base_url_entry = ttk.Entry(custom_model_frame, width=50)
-        self.base_url_entry.grid(row=3, column=0, sticky='ew', padx=5, pady=(0, 10))
-
-        # Custom Base Model Input
-        label_base_model = ttk.Label(custom_model_frame, text='Custom Base Model:', bootstyle="secondary")
-        label_base_model.grid(row=4, column=0, sticky='w', padx=5, pady=(10, 5))
-        self.base_model_entry = ttk.Entry(custom_model_frame, width=50)
-        self.base_model_entry.grid(row=5, column=0, sticky='ew', padx=5, pady=(0, 10))
-
-        # Custom Model API Key Input
-        label_custom_model_api_key = ttk.Label(custom_model_frame, text='Custom Model API Key:', bootstyle="secondary")
-        label_custom_model_api_key.grid(row=6, column=0, sticky='w', padx=5, pady=(10, 5))
-        self.custom_model_api_key_entry = ttk.Entry(custom_model_frame, width=50)
-        self.custom_model_api_key_entry.grid(row=7, column=0, sticky='ew', padx=5, pady=(0, 10))
+        # Custom Base URL, Base Model and Model API Key inputs: (label text, entry attribute), one label row and
+        # one entry row each, built in a single pass
+        custom_model_fields = [
+            ('Custom Base URL:', 'base_url_entry'),
+            ('Custom Base Model:', 'base_model_entry'),
+            ('Custom Model API Key:', 'custom_model_api_key_entry'),
+        ]
+        for row, (label_text, entry_attr) in enumerate(custom_model_fields, start=1):
+            ttk.Label(custom_model_frame, text=label_text, style=_SECONDARY_LABEL).grid(
+                row=2 * row, column=0, sticky='w', padx=5, pady=(10, 5))
+            entry = ttk.Entry(custom_model_frame, width=50)
+            entry.grid(row=2 * row + 1, column=0, sticky='ew', padx=5, pady=(0, 10))
+            setattr(self, entry_attr, entry)
 
         # Save Button for Custom Model Settings
         save_custom_model_button = ttk.Button(
@@ -146,18 +169,21 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
         reload_button.grid(row=2, column=0, sticky='ew', padx=5, pady=(0, 10))
 
         # Populate UI
-        settings_dict = self.settings.get_dict()
-
-        if 'api_key' in settings_dict:
-            self.api_key_entry.insert(0, settings_dict['api_key'])
-        if 'model' in settings_dict:
-            self.model_var.set(settings_dict['model'])
-        if 'base_url' in settings_dict:
-            self.base_url_entry.insert(0, settings_dict['base_url'])
-        if 'base_model' in settings_dict:
-            self.base_model_entry.insert(0, settings_dict['base_model'])
-        if 'custom_model_api_key' in settings_dict:
-            self.custom_model_api_key_entry.insert(0, settings_dict['custom_model_api_key'])
+        self.populate_fields(_cached_settings())
+
+    def populate_fields(self, settings_dict: dict[str, str]) -> None:
+        # Fill every widget in FIELDS whose setting is present
+        for key, attr, kind in self.FIELDS:
+            value = settings_dict.get(key)
+            if value is None:
+                continue
+            widget = getattr(self, attr)
+            if kind == 'entry':
+                widget.delete(0, 'end')
+                widget.insert(0, value)
+            else:
+                widget.set(value)
+                self._model_value = value
 
     def save_openai_settings(self) -> None:
         # Save OpenAI specific settings
@@ -167,21 +193,14 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
         api_key = self.api_key_entry.get().strip()
 
         # Save Model if present
-        model = self.model_var.get()
+        model = self._model_value
 
         if api_key:
             settings_dict['api_key'] = api_key
 
         settings_dict['model'] = model
 
-        # Save settings
-        self.settings.save_settings_to_file(settings_dict)
-
-        # Update model display label in main window
-        if hasattr(self, 'parent') and hasattr(self.parent, 'model_display_label'):
-            self.parent.model_display_label.configure(text=f"Current Model: {model}")
-
-        self.destroy()
+        self._save_common(settings_dict, model)
 
     def save_custom_model_settings(self) -> None:
         # Save settings for Custom Model
@@ -205,36 +224,36 @@ class AdvancedSettingsWindow(ttk.Toplevel, UILoggingMixin):
             # Override the active API key with custom model API key
             settings_dict['api_key'] = custom_model_api_key
 
+        self._save_common(settings_dict, base_model if base_model else 'Custom Model')
+
+    def _save_common(self, settings_dict: dict[str, str], display_model: str) -> None:
         # Save settings
-        self.settings.save_settings_to_file(settings_dict)
+        Settings().save_settings_to_file(settings_dict)
+        _invalidate_cached_settings()
 
         # Update model display label in main window
-        if hasattr(self, 'parent') and hasattr(self.parent, 'model_display_label'):
-            display_model = base_model if base_model else 'Custom Model'
-            self.parent.model_display_label.configure(text=f"Current Model: {display_model}")
+        if self._main_window is not None:
+            set_label_text(self._main_window.model_display_label, f"Current Model: {display_model}")
+
+        self.hide()
+
+    def show(self) -> None:
+        # Re-open a hidden window with fresh settings instead of rebuilding it. The fields are refilled and laid
+        # out while the window is still withdrawn, so it maps once with its final contents.
+        self.reload_button()
+        self.update_idletasks()
+        self.deiconify()
+        self.lift()
+        self.grab_set()
 
-        self.destroy()
+    def hide(self) -> None:
+        # Keep the widgets around for the next open
+        self.grab_release()
+        self.withdraw()
 
     def reload_button(self) -> None:
         # Reload settings from file
-        settings_dict = self.settings.get_dict()
+        settings_dict = _cached_settings()
 
         # Repopulate UI with current settings
-        if 'api_key' in settings_dict:
-            self.api_key_entry.delete(0, 'end')
-            self.api_key_entry.insert(0, settings_dict['api_key'])
-
-        if 'model' in settings_dict:
-            self.model_var.set(settings_dict['model'])
-
-        if 'base_url' in settings_dict:
-            self.base_url_entry.delete(0, 'end')
-            self.base_url_entry.insert(0, settings_dict['base_url'])
-
-        if 'base_model' in settings_dict:
-            self.base_model_entry.delete(0, 'end')
-            self.base_model_entry.insert(0, settings_dict['base_model'])
-
-        if 'custom_model_api_key' in settings_dict:
-            self.custom_model_api_key_entry.delete(0, 'end')
-            self.custom_model_api_key_entry.insert(0, settings_dict['custom_model_api_key'])
\ No newline at end of file
+        self.populate_fields(settings_dict)
\ No newline at end of file
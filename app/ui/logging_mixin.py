@@ -1,12 +1,16 @@
 import logging
-import threading
+import time
 import traceback
-from datetime import datetime
-from typing import Union, Optional, Dict, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Union, Optional, Dict, Any
 
-import ttkbootstrap as ttk
-from PIL import Image, ImageTk
-from ui.ui_utils import text_widget_editable
+from ui.ui_utils import trim_text_lines
+
+if TYPE_CHECKING:
+    # PIL is only imported when the first screenshot is shown
+    from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +20,17 @@ class UILoggingMixin:
     A mixin class providing advanced logging capabilities for UI components.
     """
 
-    def resize_image_thumbnail(self, image: Image.Image, max_width: int = 300) -> Image.Image:
+    # Thumbnails kept referenced while shown in the output log
+    THUMB_REFS_SIZE = 32
+    # log_system_action entries are written every LOG_DRAIN_INTERVAL_MS, at most LOG_DRAIN_BATCH at a time
+    LOG_DRAIN_INTERVAL_MS = 100
+    LOG_DRAIN_BATCH = 200
+    # Screen used by display_screenshot_in_output_log, created on first use
+    _screen = None
+    # Shared by all windows; screenshot resizing never runs on the Tk thread
+    _thumb_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='thumbnail')
+
+    def resize_image_thumbnail(self, image: 'Image.Image', max_width: int = 300) -> 'Image.Image':
         """
         Resize an image to a thumbnail while maintaining aspect ratio.
 
@@ -24,50 +38,99 @@ class UILoggingMixin:
         :param max_width: Maximum width for the thumbnail
         :return: Resized PIL Image
         """
-        width_percent = (max_width / float(image.size[0]))
-        height_size = int((float(image.size[1]) * float(width_percent)))
-        return image.resize((max_width, height_size), Image.LANCZOS)
+        from PIL import Image
+        width, height = image.size
+        if width <= max_width:
+            return image.copy()
+        # Resize straight from the original instead of copying it first for thumbnail(). BILINEAR is much cheaper
+        # than LANCZOS at this size, and reducing_gap shrinks by a whole factor with a box filter before resampling.
+        thumbnail_height = max(1, round(height * max_width / width))
+        return image.resize((max_width, thumbnail_height), Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    @staticmethod
+    def _maybe_see_top(text_widget) -> None:
+        """
+        Scroll a text widget to the top, unless the user has scrolled down to read older lines.
 
-    def update_output_log(self, message: str, screenshot: Optional[Image.Image] = None) -> None:
+        :param text_widget: Tkinter text widget that new lines are inserted at the top of
+        """
+        first_visible_line = int(text_widget.index('@0,0').split('.')[0])
+        if first_visible_line <= 3:
+            text_widget.see('1.0')
+
+    def update_output_log(self, message: str, screenshot: Optional['Image.Image'] = None) -> None:
         """
         Update the output log with a message and optional screenshot.
 
+        The screenshot is resized on a worker thread; the message and thumbnail are inserted together once
+        it is ready.
+
         :param message: Text message to display in the output log
         :param screenshot: Optional PIL Image object to display as a thumbnail
         """
+        if screenshot:
+            future = self._thumb_executor.submit(self.resize_image_thumbnail, screenshot)
+            future.add_done_callback(lambda f: self.output_log_text.after(0, self._install_thumbnail, message, f))
+            return
+
         try:
-            with text_widget_editable(self.output_log_text) as output_log:
-                # Clear previous content if message is empty
-                if not message and not screenshot:
-                    output_log.delete('1.0', 'end')
+            # The output log stays in the normal state (see make_read_only), so write to it directly
+            output_log = self.output_log_text
+            # Clear previous content if message is empty
+            if not message:
+                output_log.delete('1.0', 'end')
 
-                # Insert message
-                if message:
-                    output_log.insert('1.0', f"{message}\n")
+            # Insert message
+            if message:
+                output_log.insert('1.0', f"{message}\n")
+                trim_text_lines(output_log)
 
-                # Insert screenshot thumbnail if provided
-                if screenshot:
-                    try:
-                        # Resize screenshot to a thumbnail
-                        thumbnail = self.resize_image_thumbnail(screenshot)
+            # Scroll to the top
+            self._maybe_see_top(output_log)
 
-                        # Convert PIL Image to PhotoImage for Tkinter
-                        photo = ImageTk.PhotoImage(thumbnail)
+        except Exception as e:
+            logger.error(f"Error in update_output_log: {e}")
 
-                        # Insert the image into the text widget
-                        output_log.image_create('1.0', image=photo)
-                        # Keep a reference to prevent garbage collection
-                        output_log.image = photo
+    def _install_thumbnail(self, message: str, future: Future) -> None:
+        """
+        Insert a message and its screenshot thumbnail into the output log. Runs on the Tk thread.
 
-                        # Add a newline after the image
-                        output_log.insert('1.0', '\n')
+        :param message: Text message to display above the thumbnail
+        :param future: Finished resize of the screenshot
+        """
+        try:
+            output_log = self.output_log_text
+
+            # Insert message
+            if message:
+                output_log.insert('1.0', f"{message}\n")
+
+            try:
+                from PIL import ImageTk
+                # The PhotoImage holds its own copy of the pixels
+                with future.result() as thumbnail:
+                    photo = ImageTk.PhotoImage(thumbnail)
 
-                    except Exception as img_error:
-                        logger.error(f"Failed to process screenshot: {img_error}")
-                        output_log.insert('1.0', f"[ERROR] Failed to process screenshot\n")
+                # Insert the image into the text widget
+                output_log.image_create('1.0', image=photo)
+                # Keep references to the latest thumbnails to prevent garbage collection while they are shown.
+                # Bounded, so thumbnails scrolled far down can be freed.
+                photo_refs = getattr(output_log, '_photo_refs', None)
+                if photo_refs is None:
+                    photo_refs = output_log._photo_refs = deque(maxlen=self.THUMB_REFS_SIZE)
+                photo_refs.append(photo)
 
-                # Scroll to the top
-                output_log.see('1.0')
+                # Add a newline after the image
+                output_log.insert('1.0', '\n')
+
+            except Exception as img_error:
+                logger.error(f"Failed to process screenshot: {img_error}")
+                output_log.insert('1.0', f"[ERROR] Failed to process screenshot\n")
+
+            trim_text_lines(output_log)
+
+            # Scroll to the top
+            self._maybe_see_top(output_log)
 
         except Exception as e:
             logger.error(f"Error in update_output_log: {e}")
@@ -88,30 +151,58 @@ class UILoggingMixin:
                 return details
             return ''
 
-        def log_action():
-            # Prepare the log message
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            formatted_details = format_details(details)
+        # Prepare the log message
+        # Formatted by hand from time.localtime(), which skips strftime's locale handling
+        now = time.localtime()
+        timestamp = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        formatted_details = format_details(details)
+
+        # Construct log entry
+        if formatted_details:
+            log_entry = f"[{timestamp}] {action_type}: {formatted_details}\n"
+        else:
+            log_entry = f"[{timestamp}] {action_type}\n"
+
+        # Safe from any thread; the Tk thread writes queued entries in batches (see _drain_log_queue)
+        self._log_queue.put_nowait(log_entry)
+        self._schedule_log_drain()
 
-            # Construct log entry
-            if formatted_details:
-                log_entry = f"[{timestamp}] {action_type}: {formatted_details}\n"
-            else:
-                log_entry = f"[{timestamp}] {action_type}\n"
+    def start_log_queue(self) -> None:
+        """
+        Start writing log_system_action entries to the Output Log. Call once from the Tk thread after creating
+        output_log_text.
+        """
+        self._log_queue = SimpleQueue()
+        self._log_drain_scheduled = False
+
+    def _schedule_log_drain(self) -> None:
+        # Only wake up the Tk thread when there is something to write, at most once per LOG_DRAIN_INTERVAL_MS
+        if not self._log_drain_scheduled:
+            self._log_drain_scheduled = True
+            self.output_log_text.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+
+    def _drain_log_queue(self) -> None:
+        # Clear the flag before draining, so an entry queued meanwhile schedules the next drain
+        self._log_drain_scheduled = False
+        log_entries = []
+        try:
+            while len(log_entries) < self.LOG_DRAIN_BATCH:
+                log_entries.append(self._log_queue.get_nowait())
+        except Empty:
+            pass
 
-            # Thread-safe log update using context manager
+        if log_entries:
+            # Newest entry first, matching one insert('1.0', ...) per entry
             try:
-                with text_widget_editable(self.output_log_text) as output_log:
-                    output_log.insert('1.0', log_entry)
-                    output_log.see('1.0')
+                self.output_log_text.insert('1.0', ''.join(reversed(log_entries)))
+                trim_text_lines(self.output_log_text)
+                self._maybe_see_top(self.output_log_text)
             except Exception as e:
                 logger.error(f"Logging error: {e}")
 
-        # Ensure thread-safe execution
-        if threading.current_thread() is threading.main_thread():
-            log_action()
-        else:
-            self.output_log_text.after(0, log_action)
+        # More than LOG_DRAIN_BATCH entries were queued: write the rest on the next drain
+        if len(log_entries) == self.LOG_DRAIN_BATCH:
+            self._schedule_log_drain()
 
     def display_screenshot_in_output_log(self) -> None:
         """
@@ -122,27 +213,46 @@ class UILoggingMixin:
 
         Handles potential import and screenshot capture errors gracefully.
         """
-        try:
-            from utils.screen import Screen
-        except ImportError:
-            self.update_output_log("Error: Screen utility not available")
-            return
-
-        try:
-            # Capture screenshot with error handling for screenshot capture
-            screenshot = Screen().get_screenshot()
+        # One Screen instance shared by all windows; the import stays lazy so pyautogui loads on first use
+        if UILoggingMixin._screen is None:
+            try:
+                from utils.screen import Screen
+            except ImportError:
+                self.update_output_log("Error: Screen utility not available")
+                return
+            UILoggingMixin._screen = Screen()
+        screen = UILoggingMixin._screen
 
+        def capture():
+            # Runs on the thumbnail worker: capture and resize off the Tk thread
+            screenshot = screen.get_screenshot()
             if screenshot is None:
-                self.update_output_log("No screenshot could be captured")
-                return
+                return None
+            # Each capture is a new image that is never shown again, so free its pixels once resized
+            with screenshot:
+                return self.resize_image_thumbnail(screenshot)
 
-            # Display screenshot in output log with a descriptive message
-            self.update_output_log("Screenshot captured:", screenshot)
+        def install(future):
+            # Runs on the Tk thread
+            try:
+                # Capture screenshot with error handling for screenshot capture
+                thumbnail = future.result()
 
-        except Exception as e:
-            # Log any errors that occur during screenshot capture or display
-            error_details = f"Unexpected error capturing screenshot: {str(e)}\n{traceback.format_exc()}"
-            self.update_output_log(error_details)
+                if thumbnail is None:
+                    self.update_output_log("No screenshot could be captured")
+                    return
+
+                # Display screenshot in output log with a descriptive message
+                self._install_thumbnail("Screenshot captured:", future)
+
+            except Exception as e:
+                # Log any errors that occur during screenshot capture or display
+                error_details = (f"Unexpected error capturing screenshot: {str(e)}\n"
+                                 f"{''.join(traceback.format_exception(e))}")
+                self.update_output_log(error_details)
+
+        self._thumb_executor.submit(capture).add_done_callback(
+            lambda f: self.output_log_text.after(0, install, f))
 
     def mock_system_action(self, action_name: str, *args, **kwargs) -> None:
         """
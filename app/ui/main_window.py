@@ -3,35 +3,153 @@ import sys
 import threading
 import logging
 import re
-from datetime import datetime
-from typing import Union, Optional, Dict, Any
-from multiprocessing import Queue
-import importlib.util
+import itertools
+from collections import deque
+from functools import lru_cache
+from queue import SimpleQueue
+from tkinter import TclError
+from typing import NamedTuple
 
 import ttkbootstrap as ttk
-from PIL import Image, ImageTk
+from ttkbootstrap.themes.standard import STANDARD_THEMES
 
 from ui.logging_mixin import UILoggingMixin
-from utils.settings import Settings
-from ui.ui_utils import text_widget_editable
+from ui.ui_utils import _cached_settings, make_read_only, phrase_trie_pattern, set_label_text, trim_text_lines
 from version import version
 
 logger = logging.getLogger(__name__)
 
+# Status messages containing any of these phrases go to the Output Log instead of the conversation
+_FILTERED_PHRASES = (
+    'fetching instructions',
+    'waiting for',
+    'typing',
+    'pressing enter',
+    'loading',
+    'based on current state',
+    'processing',
+    'preparing',
+    'initializing',
+    'submitting',
+    'opening spotlight',
+    'selecting the top',
+    'thinking',
+    'analyzing',
+    'interpreting',
+    'generating',
+    'retrieving',
+    'parsing',
+    'exception unable',
+    'user message',
+    'please send',
+    'the user has already',
+    'the user typed',
+    'the user said',
+    'press enter to submit',
+    'the user just said',
+    'user request submitted',
+    'i have already typed',
+    'i will press the enter key',
+    'responding to the user',
+    'message',
+    'typed and submitted',
+    'user said',
+    'user requested',
+    'user sent',
+    'the user request',
+)
+
+
+_FILTERED_RE = re.compile(phrase_trie_pattern(_FILTERED_PHRASES), re.IGNORECASE)
+
+
+# PhotoImages of image files by path, so reopening a window doesn't decode the same file again
+_IMAGE_CACHE = {}
+
+
+def _decode_image(path: str):
+    """
+    Decoded PIL image of an image file that isn't cached yet, else None. Safe to call from a worker thread, so
+    the decoding stays off the Tk thread; pass the result to _image.
+    """
+    if path in _IMAGE_CACHE:
+        return None
+    from PIL import Image
+    with Image.open(path) as image:
+        image.load()
+        return image.copy()
+
+
+def _image(path: str, decoded=None):
+    """
+    PhotoImage of an image file, decoded on first use unless already decoded by _decode_image. Must run on the
+    Tk thread.
+    """
+    photo = _IMAGE_CACHE.get(path)
+    if photo is None:
+        from PIL import Image, ImageTk
+        with decoded if decoded is not None else Image.open(path) as image:
+            photo = ImageTk.PhotoImage(image)
+        _IMAGE_CACHE[path] = photo
+    elif decoded is not None:
+        decoded.close()
+    return photo
+
+
+@lru_cache(maxsize=1)
+def _get_mobile_server_module():
+    """
+    The mobile_server module, imported on the first open_mobile_interface (it pulls in Gradio).
+    """
+    # Add project root to Python path
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    import importlib
+    return importlib.import_module('mobile_server')
+
+
+def _prevent_newline(event):
+    # Prevent newline on Enter key: trigger submit on the main window (the input box's toplevel) instead
+    event.widget.winfo_toplevel().execute_user_request()
+    return 'break'  # Completely stop the default Enter key behavior
+
+
+class UICommand(NamedTuple):
+    """
+    Request sent from the UI to Core through user_request_queue.
+    """
+    id: str
+    command: str
+    type: str = 'text'
+
 
 class MainWindow(ttk.Window, UILoggingMixin):
+    # (lower-case message prefix, handler method) checked in order before the filtered phrases; the handler gets
+    # the rest of the message
+    _MESSAGE_ROUTES = (
+        ('sending status:', '_route_status'),
+    )
+
     def change_theme(self, theme_name: str) -> None:
         self.style.theme_use(theme_name)
 
     def __init__(self):
-        settings = Settings()
-        settings_dict = settings.get_dict()
+        settings_dict = _cached_settings()
         theme = settings_dict.get('theme', 'superhero')
+        # Fall back to the default theme up front rather than constructing the window twice
+        # https://github.com/AmberSahdev/Open-Interface/issues/35
+        if theme not in STANDARD_THEMES:
+            theme = 'superhero'
 
         try:
             super().__init__(themename=theme)
-        except:
-            super().__init__()  # https://github.com/AmberSahdev/Open-Interface/issues/35
+        except TclError:
+            super().__init__()
+
+        # Stay hidden while the widgets are gridded so the window is laid out once, at the end of __init__
+        self.withdraw()
 
         self.title('J AI Compute')
 
@@ -64,13 +182,29 @@ class MainWindow(ttk.Window, UILoggingMixin):
 
         # Carefully control frame's column and row configurations
         frame.grid_columnconfigure(0, weight=1)
-        frame.grid_columnconfigure(1, weight=0)  # Minimal weight for second column
+        frame.grid_columnconfigure(1, weight=1)  # Submit / Cancel share the width evenly
         frame.grid_rowconfigure(5, weight=1)  # Give weight to Output Log row
 
-        # MP Queue to facilitate communication between UI and Core.
+        # Queue to facilitate communication between UI and Core.
         # Put user requests received from UI text box into this queue which will then be dequeued in App to be sent
-        # to core.
-        self.user_request_queue = Queue()
+        # to core. App reads it from a thread in this process, so no MP Queue pipe or pickling is needed.
+        self.user_request_queue = SimpleQueue()
+
+        # Messages waiting for the next conversation text update (see update_message)
+        self._msg_queue = deque()
+        self._pump_scheduled = False
+        # Marks at the start of the "Thinking..." lines still shown, top line last
+        self._thinking_marks = []
+        self._thinking_mark_ids = itertools.count()
+        # Pending after() that shows "Thinking..." (see begin_thinking)
+        self._thinking_after_id = None
+
+        # Settings window, kept hidden between opens (see open_settings)
+        self._settings_window = None
+
+        # Running mobile server, reused by open_mobile_interface, and whether one is being launched
+        self.mobile_server = None
+        self._mobile_server_starting = False
 
         # Heading with centered text
         heading_label = ttk.Label(
@@ -119,25 +253,17 @@ class MainWindow(ttk.Window, UILoggingMixin):
         )
         self.input_command_frame.grid_columnconfigure(0, weight=1)
 
-        # Prevent newline on Enter key
-        def prevent_newline(event):
-            # Trigger submit instead of adding a newline
-            self.execute_user_request()
-            return 'break'  # Completely stop the default Enter key behavior
-
-        # Bind Enter key to submit without newline
-        self.input_text.bind('<Return>', prevent_newline)
-        self.input_text.bind('<KP_Enter>', prevent_newline)
-        self.input_text.bind('<Shift-Return>', lambda event: None)  # Allow Shift+Enter for actual newline if needed
-
-        # Dynamic text box resizing
-        def on_input_change(event):
-            # Adjust text box height based on content
-            lines = self.input_text.get('1.0', 'end-1c').count('\n') + 1
-            current_height = self.input_text.winfo_height()
-            self.input_text.configure(height=min(max(2, lines), 10))  # Limit max height to 10 rows
+        # Bind Enter key to submit without newline, through a bind tag ahead of the Text class bindings
+        self.input_text.bindtags(('InputText',) + self.input_text.bindtags())
+        self.bind_class('InputText', '<Return>', _prevent_newline)
+        self.bind_class('InputText', '<KP_Enter>', _prevent_newline)
+        self.bind_class('InputText', '<Shift-Return>', lambda event: None)  # Allow Shift+Enter for actual newline if needed
 
-        self.input_text.bind('<KeyRelease>', on_input_change)
+        # Dynamic text box resizing, debounced so a burst of typing triggers a single relayout. <<Modified>> only
+        # fires when the text actually changes (not for arrows, Shift, etc.)
+        self._resize_job = None
+        self._input_height = 2
+        self.input_text.bind('<<Modified>>', self.on_input_change_modified)
 
         # Submit Button - make responsive
         self.submit_button = ttk.Button(
@@ -170,8 +296,6 @@ class MainWindow(ttk.Window, UILoggingMixin):
         )
 
         # Model Display Label
-        settings = Settings()
-        settings_dict = settings.get_dict()
         self.model_display_label = ttk.Label(
             frame,
             text=f"Current Model: {settings_dict.get('model', 'Not Set')}",
@@ -231,6 +355,9 @@ class MainWindow(ttk.Window, UILoggingMixin):
             height=6,
             yscrollcommand=self.conversation_text_scrollbar.set
         )
+        # Read-only for the user (copy and navigation still work), but left in the normal state so messages need no
+        # state toggles
+        make_read_only(self.conversation_text)
         self.conversation_text.grid(
             row=0,
             column=0,
@@ -246,11 +373,6 @@ class MainWindow(ttk.Window, UILoggingMixin):
         self.conversation_frame.grid_rowconfigure(0, weight=1)
         self.conversation_frame.grid_columnconfigure(0, weight=1)
 
-        # Ensure the main frame can expand
-        frame.grid_columnconfigure(0, weight=1)
-        frame.grid_columnconfigure(1, weight=1)
-        frame.grid_rowconfigure(6, weight=1)  # Critical: give weight to Output Log row
-
         # Output Log Frame - card-like border with full expansion
         self.output_log_frame = ttk.LabelFrame(
             frame,
@@ -296,9 +418,11 @@ class MainWindow(ttk.Window, UILoggingMixin):
             wrap=ttk.WORD,
             font=('Arial', 12),  # Larger font
             height=6,  # Initial height
-            state='disabled',  # Read-only
             yscrollcommand=self.output_log_scrollbar.set
         )
+        # Read-only for the user, but left in the normal state so log writes need no state toggles
+        make_read_only(self.output_log_text)
+        self.start_log_queue()
         self.output_log_text.grid(
             row=0,
             column=0,
@@ -369,163 +493,195 @@ class MainWindow(ttk.Window, UILoggingMixin):
             pady=10
         )
 
+        self.update_idletasks()
+        self.deiconify()
+
+    def on_input_change_modified(self, event=None) -> None:
+        # Resetting the modified flag fires <<Modified>> again; ignore that one
+        if not self.input_text.edit_modified():
+            return
+        self.input_text.edit_modified(False)
+        self.on_input_change()
+
+    def on_input_change(self, event=None) -> None:
+        if self._resize_job:
+            self.input_text.after_cancel(self._resize_job)
+        self._resize_job = self.input_text.after(75, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_job = None
+        # Adjust text box height based on content; Tk reports the line count without copying the text
+        lines = int(self.input_text.index('end-1c').split('.')[0])
+        height = min(max(2, lines), 10)  # Limit max height to 10 rows
+        # Skip the relayout when the line count changed within the same height
+        if height != self._input_height:
+            self._input_height = height
+            self.input_text.configure(height=height)
+
     def open_settings(self) -> None:
         from ui.settings_window import SettingsWindow
-        SettingsWindow(self)
+        # Reuse the hidden window from an earlier open; it is only rebuilt if it was destroyed
+        if self._settings_window is None or not self._settings_window.winfo_exists():
+            self._settings_window = SettingsWindow(self)
+        else:
+            self._settings_window.show()
 
     def stop_previous_request(self) -> None:
-        # Interrupt currently running request by queueing a stop signal as a dictionary.
-        self.user_request_queue.put({'command': 'stop'})
+        # Interrupt currently running request by queueing a stop signal.
+        self.user_request_queue.put(UICommand('ui_command', 'stop'))
 
     def display_input(self) -> str:
         # Get the input and update the conversation display
-        user_input = self.input_text.get("1.0", "end-1c")
-
-        # Enable text widget to insert text
-        self.conversation_text.configure(state='normal')
+        user_input = self.input_text.get("1.0", "end-1c").strip()
 
         # Insert user input if not empty at the TOP with the 'you' tag
-        if user_input.strip():
+        if user_input:
+            conversation_text = self.conversation_text
             # Insert at the top with the 'you' tag for formatting
-            self.conversation_text.insert('1.0', f'You: {user_input.strip()}\n', 'you')
-            
-            # Scroll to the top
-            self.conversation_text.see('1.0')
+            conversation_text.insert('1.0', f'You: {user_input}\n', 'you')
+            trim_text_lines(conversation_text)
 
-        # Disable text widget to make it read-only
-        self.conversation_text.configure(state='disabled')
+            # Scroll to the top
+            self._maybe_see_top(conversation_text)
 
         # Clear the input text box
         self.input_text.delete('1.0', ttk.END)
 
-        return user_input.strip()
+        return user_input
 
     def update_message(self, message: str) -> None:
-       # Update the conversation text with AI replies only
-        # Ensure thread safety when updating the Tkinter GUI.
-        def update_text():
-            # Comprehensive list of phrases to filter out
-            filtered_phrases = [
-                'fetching instructions',
-                'waiting for',
-                'typing',
-                'pressing enter',
-                'loading',
-                'based on current state',
-                'processing',
-                'preparing',
-                'initializing',
-                'submitting',
-                'opening spotlight',
-                'selecting the top',
-                'thinking',
-                'analyzing',
-                'interpreting',
-                'generating',
-                'retrieving',
-                'parsing',
-                'exception unable',
-                'user message',
-                'typing',
-                'please send',
-                'the user has already',
-                'the user typed',
-                'the user said',
-                'pressing enter',
-                'press enter to submit',
-                'the user just said',
-                'user request submitted',
-                'i have already typed',
-                'i will press the enter key',
-                'responding to the user',
-                'message',
-                'typed and submitted',
-                'user said',
-                'user requested',
-                'user sent',
-                'the user request'
-            ]
-
-            # Check if the message should be filtered
-            should_filter = any(
-                phrase in message.lower()
-                for phrase in filtered_phrases
-            )
-
-            # Enable text widget to insert text
-            self.conversation_text.configure(state='normal')
-
-            # Insert only meaningful AI responses at the TOP
-            if message.strip() and not should_filter:
-                # Remove any previous "Thinking..." message
-                thinking_start = self.conversation_text.search('AI: Thinking...', '1.0', stopindex='end')
-                if thinking_start:
-                    thinking_end = f"{thinking_start} lineend+1c"
-                    self.conversation_text.delete(thinking_start, thinking_end)
-
-                # Insert at the top of the text with the 'ai' tag for formatting
-                self.conversation_text.insert('1.0', f'AI: {message.strip()}\n', 'ai')
+        # Queue the message; a pump running every 16 ms (about once per frame) writes all queued messages to the
+        # conversation text in one go instead of redrawing once per status update.
+        # Safe to call from any thread: only the deque and after() are touched here.
+        self._msg_queue.append(message)
+        self._schedule_flush()
+
+    def update_messages(self, messages: list[str]) -> None:
+        # Same as update_message for a burst of messages, scheduling the pump at most once
+        self._msg_queue.extend(messages)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._pump_scheduled:
+            self._pump_scheduled = True
+            self.after(16, self._flush_messages)
+
+    def _flush_messages(self) -> None:
+        # Clear the flag before draining: a message queued while draining then schedules another pump instead of
+        # waiting in the queue for the next message
+        self._pump_scheduled = False
+        messages = []
+        while self._msg_queue:
+            messages.append(self._msg_queue.popleft())
+        if messages:
+            self._apply_messages(messages)
+
+    def begin_thinking(self) -> None:
+        # Show "Thinking..." only if no reply arrives within 200 ms of dispatching a request
+        if self._thinking_after_id is None:
+            self._thinking_after_id = self.after(200, self._show_thinking)
+
+    def _show_thinking(self) -> None:
+        self._thinking_after_id = None
+        # Insert "Thinking..." message at the top with the 'ai' tag
+        conversation_text = self.conversation_text
+        conversation_text.insert('1.0', 'AI: Thinking...\n', 'ai')
+        # Mark the start of the line. The mark keeps the default right gravity, so it moves down with its line as
+        # text is inserted above.
+        mark = f'thinking{next(self._thinking_mark_ids)}'
+        conversation_text.mark_set(mark, '1.0')
+        self._thinking_marks.append(mark)
+        trim_text_lines(conversation_text)
+        self._maybe_see_top(conversation_text)
+
+    def _apply_messages(self, messages: list[str]) -> None:
+        # Update the conversation text with AI replies only
+        replies = []
+        filtered_messages = []
+        routed_messages = []
+        conversation_text = self.conversation_text
+        for message in messages:
+            # Statuses come from the LLM's JSON, where a step may have no (or a non-string) justification
+            if not isinstance(message, str):
+                if message is None:
+                    continue
+                message = str(message)
+            text = message.strip()
+            if not text:
+                continue
+
+            # Messages with a known prefix go straight to their handler
+            # Only the prefix is lowercased, not the whole message
+            for prefix, handler_name in self._MESSAGE_ROUTES:
+                if text[:len(prefix)].lower() == prefix:
+                    routed_messages.append((handler_name, text[len(prefix):].strip()))
+                    break
+            else:
+                # Check if the message should be filtered
+                if _FILTERED_RE.search(text):
+                    filtered_messages.append(message)
+                    continue
+
+                # Keep only meaningful AI responses
+                # The reply is here: don't show "Thinking..." if it hasn't been shown yet
+                if self._thinking_after_id is not None:
+                    self.after_cancel(self._thinking_after_id)
+                    self._thinking_after_id = None
+                # Remove the latest "Thinking..." message by its mark instead of searching the text
+                elif self._thinking_marks:
+                    mark = self._thinking_marks.pop()
+                    conversation_text.delete(mark, f"{mark} lineend+1c")
+                    conversation_text.mark_unset(mark)
+
+                replies.append(f'AI: {text}\n')
+
+        # Insert all replies at the top of the text with the 'ai' tag in one call, newest first
+        # (a "Thinking..." line is only ever removed for a reply, so without replies the text is unchanged)
+        if replies:
+            conversation_text.insert('1.0', ''.join(reversed(replies)), 'ai')
+            trim_text_lines(conversation_text)
 
             # Scroll to the top
-            self.conversation_text.see('1.0')
+            self._maybe_see_top(conversation_text)
 
-            # Disable text widget to make it read-only
-            self.conversation_text.configure(state='disabled')
+        for handler_name, rest in routed_messages:
+            getattr(self, handler_name)(rest)
 
+        for message in filtered_messages:
             # Log filtered messages in Output Log
-            if message.strip() and should_filter:
-                self.update_output_log(message)
+            self.update_output_log(message)
 
-            # Log status messages
-            if 'Sending status:' in message:
-                status = message.split('Sending status:')[-1].strip()
-                self.log_system_action('Status', {'message': status})
-
-        def show_thinking():
-            # Enable text widget to insert text
-            self.conversation_text.configure(state='normal')
-
-            # Insert "Thinking..." message at the top with the 'ai' tag
-            self.conversation_text.insert('1.0', 'AI: Thinking...\n', 'ai')
-
-            # Scroll to the top
-            self.conversation_text.see('1.0')
-
-            # Disable text widget to make it read-only
-            self.conversation_text.configure(state='disabled')
-
-        # Schedule show_thinking and update_text to run on the main thread using after
-        self.after(0, show_thinking)
-        self.after(1000, update_text)
+    def _route_status(self, status: str) -> None:
+        # Log status messages
+        self.log_system_action('Status', {'message': status})
 
     def open_mobile_interface(self):
         """
         Open the mobile interface and display QR code.
 
         Creates a Gradio server and displays QR code in a popup window.
+        The server is started once; later clicks only show the QR code again.
         """
+        # Server already running: reuse it and its QR code
+        if self.mobile_server is not None and self.mobile_server.public_url:
+            public_url = self.mobile_server.public_url
+            self._show_qr_popup(public_url, self.mobile_server.generate_qr_code(public_url))
+            return
+
+        # A launch is already in progress, its popup shows up when it's ready
+        if self._mobile_server_starting:
+            return
+        self._mobile_server_starting = True
 
         def launch_mobile_server():
             try:
-                # Add project root to Python path
-                project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-                if project_root not in sys.path:
-                    sys.path.insert(0, project_root)
-
-                # Dynamically import mobile_server module
-                mobile_server_path = os.path.join(os.path.dirname(__file__), 'mobile_server.py')
-                spec = importlib.util.spec_from_file_location("mobile_server", mobile_server_path)
-                mobile_server_module = importlib.util.module_from_spec(spec)
-                sys.modules["mobile_server"] = mobile_server_module
-                spec.loader.exec_module(mobile_server_module)
-
                 # Create mobile server instance with current core
                 core_instance = getattr(self, 'core', None)
                 if core_instance is None:
                   from core import Core
                   core_instance = Core()
 
-                mobile_server = mobile_server_module.MobileServer(core_instance=core_instance)
+                mobile_server = _get_mobile_server_module().MobileServer(core_instance=core_instance)
 
                 # Start server and get public URL
                 public_url = mobile_server.start()
@@ -536,85 +692,81 @@ class MainWindow(ttk.Window, UILoggingMixin):
 
                 # Generate QR code
                 qr_code_path = mobile_server.generate_qr_code(public_url)
+                # Decode the PNG here; only the PhotoImage is created on the main thread
+                qr_image = _decode_image(qr_code_path)
 
-                # Display QR code in a popup window (thread-safe)
-                def update_ui():
-                    try:
-                        # Create QR Code Popup Window
-                        qr_popup = ttk.Toplevel(self)
-                        qr_popup.title("Mobile Interface QR Code")
-                        qr_popup.geometry("400x400")
-                        qr_popup.resizable(False, False)
-
-                        # Position the popup next to the main window
-                        main_window_geo = self.geometry()
-                        main_x = self.winfo_x()
-                        main_y = self.winfo_y()
-                        main_width = self.winfo_width()
-
-                        # Parse main window geometry
-                        geo_match = re.match(r'(\d+)x(\d+)\+(\d+)\+(\d+)', main_window_geo)
-                        if geo_match:
-                            # Position popup to the right of the main window
-                            popup_x = main_x + main_width + 10
-                            popup_y = main_y
-                            qr_popup.geometry(f"+{popup_x}+{popup_y}")
-
-                        # Frame to organize content
-                        content_frame = ttk.Frame(qr_popup)
-                        content_frame.pack(expand=True, fill='both', padx=10, pady=10)
-
-                        # QR Code Label
-                        qr_label = ttk.Label(content_frame)
-                        qr_label.pack(pady=(0, 10), expand=True)
-
-                        # Load and convert QR code image
-                        qr_image = Image.open(qr_code_path)
-                        qr_photo = ImageTk.PhotoImage(qr_image)
-
-                        # Insert the image into the text widget
-                        qr_label.configure(image=qr_photo)
-                        qr_label.image = qr_photo  # Keep a reference
-
-                        # URL Label with improved styling
-                        url_label = ttk.Label(
-                            content_frame,
-                            text=f"Scan QR to Open:\n{public_url}",
-                            font=('Arial', 8),
-                            bootstyle='secondary'
-                        )
-                        url_label.pack(pady=(5, 0))
-
-                        # Instructions Label
-                        instructions_label = ttk.Label(
-                            content_frame,
-                            text="Open Mobile Interface",
-                            font=('Arial', 7, 'italic'),
-                            bootstyle='light'
-                        )
-                        instructions_label.pack(pady=(2, 0))
-
-                    except Exception as ui_error:
-                        print(f"Error updating UI: {ui_error}")
-                        import traceback
-                        traceback.print_exc()
+                # Store mobile server for reuse by later clicks
+                self.mobile_server = mobile_server
 
                 # Schedule UI updates on the main thread
-                self.after(0, update_ui)
-
-                # Store mobile server for potential later use
-                self.mobile_server = mobile_server
+                self.after(0, self._show_qr_popup, public_url, qr_code_path, qr_image)
 
             except Exception as e:
                 # Log any errors with more detailed information
                 import traceback
                 error_message = f"Error opening mobile interface: {str(e)}\n{traceback.format_exc()}"
                 print(error_message)
-                self.update_output_log(error_message)
+                self.after(0, self.update_output_log, error_message)
+
+            finally:
+                # Allow another launch after a failure; after a success later clicks reuse self.mobile_server
+                self._mobile_server_starting = False
 
         # Start mobile server in a separate thread to prevent UI freezing
         threading.Thread(target=launch_mobile_server, daemon=True).start()
 
+    def _show_qr_popup(self, public_url: str, qr_code_path: str, qr_image=None) -> None:
+        # Display QR code in a popup window. Runs on the main thread.
+        try:
+            # Create QR Code Popup Window
+            qr_popup = ttk.Toplevel(self)
+            qr_popup.title("Mobile Interface QR Code")
+            qr_popup.geometry("400x400")
+            qr_popup.resizable(False, False)
+
+            # Position the popup to the right of the main window
+            popup_x = self.winfo_x() + self.winfo_width() + 10
+            popup_y = self.winfo_y()
+            qr_popup.geometry(f"+{popup_x}+{popup_y}")
+
+            # Frame to organize content
+            content_frame = ttk.Frame(qr_popup)
+            content_frame.pack(expand=True, fill='both', padx=10, pady=10)
+
+            # QR Code Label
+            qr_label = ttk.Label(content_frame)
+            qr_label.pack(pady=(0, 10), expand=True)
+
+            # Load and convert QR code image, once per file (the file name is unique per URL)
+            qr_photo = _image(qr_code_path, qr_image)
+
+            # Insert the image into the text widget
+            qr_label.configure(image=qr_photo)
+            qr_label.image = qr_photo  # Keep a reference
+
+            # URL Label with improved styling
+            url_label = ttk.Label(
+                content_frame,
+                text=f"Scan QR to Open:\n{public_url}",
+                font=('Arial', 8),
+                bootstyle='secondary'
+            )
+            url_label.pack(pady=(5, 0))
+
+            # Instructions Label
+            instructions_label = ttk.Label(
+                content_frame,
+                text="Open Mobile Interface",
+                font=('Arial', 7, 'italic'),
+                bootstyle='light'
+            )
+            instructions_label.pack(pady=(2, 0))
+
+        except Exception as ui_error:
+            print(f"Error updating UI: {ui_error}")
+            import traceback
+            traceback.print_exc()
+
     def create_reload_mobile_button(self):
         """
         Create a button to launch the mobile interface and generate QR code
@@ -639,20 +791,19 @@ class MainWindow(ttk.Window, UILoggingMixin):
 
     def reload_model_settings(self) -> None:
         # Reload settings from the settings file
-        settings = Settings()
-        settings_dict = settings.get_dict()
+        settings_dict = _cached_settings()
 
         # Update model display
         if 'model' in settings_dict:
             model = settings_dict['model']
-            self.model_display_label.configure(text=f"Current Model: {model}")
+            set_label_text(self.model_display_label, f"Current Model: {model}")
 
         # Update OpenAI API key and base URL if needed
         if 'base_url' in settings_dict:
             os.environ['OPENAI_BASE_URL'] = settings_dict['base_url']
 
     def execute_user_request(self, event=None) -> None:
-        # Puts the user request received from the UI into the MP queue being read in App to be sent to Core.
+        # Puts the user request received from the UI into user_request_queue, which App reads to send it to Core.
         user_request = self.display_input()
 
         if user_request == '' or user_request is None:
@@ -660,14 +811,8 @@ class MainWindow(ttk.Window, UILoggingMixin):
 
         self.update_message('Fetching Instructions')
 
-        # Wrap the user request in a dictionary with an id
-        command_obj = {
-            'id': 'ui_command',
-            'command': user_request,
-            'type': 'text'
-        }
-
-        self.user_request_queue.put(command_obj)
+        self.user_request_queue.put(UICommand('ui_command', user_request))
+        self.begin_thinking()
 
     def clear_output_log(self):
         """
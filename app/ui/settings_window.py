@@ -1,6 +1,7 @@
 import ttkbootstrap as ttk
 from ui.logging_mixin import UILoggingMixin
 from utils.settings import Settings
+from ui.ui_utils import _cached_settings, _invalidate_cached_settings
 
 
 class SettingsWindow(ttk.Toplevel, UILoggingMixin):
@@ -8,28 +9,27 @@ class SettingsWindow(ttk.Toplevel, UILoggingMixin):
     Self-contained settings sub-window for the UI
     """
 
+    AVAILABLE_THEMES = ('darkly', 'cyborg', 'journal', 'solar', 'superhero')
+
+    # (settings key, widget attribute, kind): 'text' widgets are cleared and refilled, 'flag' ones get 1/0,
+    # the rest are set() as is. The theme is set separately since it has a default.
+    FIELDS = (
+        ('default_browser', 'browser_combobox', 'value'),
+        ('play_ding_on_completion', 'play_ding', 'flag'),
+        ('custom_llm_instructions', 'llm_instructions_text', 'text'),
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
+        self._advanced_settings_window = None
         self.title('Settings')
-
-        # Initialize settings
-        self.settings = Settings()
+        # Closing with the title bar hides the window so the next open can reuse it
+        self.protocol('WM_DELETE_WINDOW', self.hide)
 
         # Set precise window dimensions
         window_width = 370
         window_height = 450
 
-        # Set window size and minimum size
-        self.geometry(f'{window_width}x{window_height}')
-        self.minsize(window_width, window_height)
-
-        # Ensure window doesn't expand unnecessarily
-        self.grid_propagate(False)
-
-        # Position the window directly on top of the parent window
-        self.transient(parent)  # Set as a child window of the parent
-        self.grab_set()  # Make modal
-
         # Calculate parent window position and center this window
         parent_x = parent.winfo_rootx()
         parent_y = parent.winfo_rooty()
@@ -39,8 +39,21 @@ class SettingsWindow(ttk.Toplevel, UILoggingMixin):
         x = parent_x + (parent_width - window_width) // 2
         y = parent_y + (parent_height - window_height) // 2
 
-        self.geometry(f'+{x}+{y}')
+        # Set window size and position in one request, then minimum size
+        self.geometry(f'{window_width}x{window_height}+{x}+{y}')
+        self.minsize(window_width, window_height)
+
+        # Ensure window doesn't expand unnecessarily
+        self.grid_propagate(False)
 
+        # Position the window directly on top of the parent window
+        self.transient(parent)  # Set as a child window of the parent
+        self.grab_set()  # Make modal
+
+        # Build the widgets on the next idle tick so the window paints first
+        self.after_idle(self._build_body)
+
+    def _build_body(self) -> None:
         # Main content frame
         content_frame = ttk.Frame(self)
         content_frame.pack(fill='both', expand=True, padx=10, pady=10)
@@ -63,10 +76,9 @@ class SettingsWindow(ttk.Toplevel, UILoggingMixin):
         theme_frame.grid(row=1, column=0, sticky='ew', padx=5, pady=(0, 10))
         theme_frame.columnconfigure(0, weight=1)
 
-        self.available_themes = ['darkly', 'cyborg', 'journal', 'solar', 'superhero']
         self.theme_combobox = ttk.Combobox(
             theme_frame,
-            values=self.available_themes,
+            values=self.AVAILABLE_THEMES,
             state='readonly'
         )
         self.theme_combobox.grid(row=0, column=0, sticky='ew', padx=5, pady=5)
@@ -128,14 +140,22 @@ class SettingsWindow(ttk.Toplevel, UILoggingMixin):
         save_button.grid(row=5, column=0, sticky='ew', padx=5, pady=(0, 10))
 
         # Populate UI
-        settings_dict = self.settings.get_dict()
-
-        if 'default_browser' in settings_dict:
-            self.browser_combobox.set(settings_dict['default_browser'])
-        if 'play_ding_on_completion' in settings_dict:
-            self.play_ding.set(1 if settings_dict['play_ding_on_completion'] else 0)
-        if 'custom_llm_instructions':
-            self.llm_instructions_text.insert('1.0', settings_dict['custom_llm_instructions'])
+        self.populate_fields(_cached_settings())
+
+    def populate_fields(self, settings_dict: dict[str, str]) -> None:
+        # Fill every widget in FIELDS whose setting is present
+        for key, attr, kind in self.FIELDS:
+            value = settings_dict.get(key)
+            if value is None:
+                continue
+            widget = getattr(self, attr)
+            if kind == 'text':
+                widget.delete('1.0', 'end')
+                widget.insert('1.0', value)
+            elif kind == 'flag':
+                widget.set(1 if value else 0)
+            else:
+                widget.set(value)
         self.theme_combobox.set(settings_dict.get('theme', 'superhero'))
 
     def on_theme_change(self, event=None):
@@ -152,27 +172,37 @@ class SettingsWindow(ttk.Toplevel, UILoggingMixin):
         settings_dict['custom_llm_instructions'] = self.llm_instructions_text.get('1.0', 'end-1c')
 
         # Save to settings file
-        self.settings.save_settings_to_file(settings_dict)
+        Settings().save_settings_to_file(settings_dict)
+        _invalidate_cached_settings()
 
         # Close the settings window
-        self.destroy()
+        self.hide()
+
+    def show(self) -> None:
+        # Re-open a hidden window with fresh settings instead of rebuilding it. The fields are refilled and laid
+        # out while the window is still withdrawn, so it maps once with its final contents.
+        self.reload_button()
+        self.update_idletasks()
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+
+    def hide(self) -> None:
+        # Keep the widgets around for the next open
+        self.grab_release()
+        self.withdraw()
 
     def reload_button(self):
         # Reload settings from file
-        settings_dict = self.settings.get_dict()
+        settings_dict = _cached_settings()
 
         # Repopulate UI with current settings
-        if 'default_browser' in settings_dict:
-            self.browser_combobox.set(settings_dict['default_browser'])
-        if 'play_ding_on_completion' in settings_dict:
-            self.play_ding.set(1 if settings_dict['play_ding_on_completion'] else 0)
-        if 'custom_llm_instructions' in settings_dict:
-            self.llm_instructions_text.delete('1.0', 'end')
-            self.llm_instructions_text.insert('1.0', settings_dict['custom_llm_instructions'])
-        self.theme_combobox.set(settings_dict.get('theme', 'superhero'))
+        self.populate_fields(settings_dict)
 
     def open_advanced_settings(self):
         # Open the Advanced Settings (AI Model Settings) window
         from ui.advanced_settings_window import AdvancedSettingsWindow
-        advanced_settings_window = AdvancedSettingsWindow(self)
-        advanced_settings_window.grab_set()  # Make the window modal
\ No newline at end of file
+        if self._advanced_settings_window is None or not self._advanced_settings_window.winfo_exists():
+            self._advanced_settings_window = AdvancedSettingsWindow(self)  # Modal; grabs input itself
+        else:
+            self._advanced_settings_window.show()
\ No newline at end of file
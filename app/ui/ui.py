@@ -8,4 +8,7 @@ class UI:
         self.main_window.mainloop()
 
     def display_current_status(self, text):
-        self.main_window.update_message(text)
\ No newline at end of file
+        self.main_window.update_message(text)
+
+    def display_current_statuses(self, statuses):
+        self.main_window.update_messages(statuses)
@@ -7,7 +7,6 @@ from multiprocessing import Queue
 from pathlib import Path
 from datetime import datetime
 from typing import Union, Optional, Dict, Any
-import re
 import logging
 import traceback
 
@@ -1121,18 +1120,14 @@ class UI:
                             qr_popup.resizable(False, False)
 
                             # Position the popup next to the main window
-                            main_window_geo = self.geometry()
                             main_x = self.winfo_x()
                             main_y = self.winfo_y()
                             main_width = self.winfo_width()
 
-                            # Parse main window geometry
-                            geo_match = re.match(r'(\d+)x(\d+)\+(\d+)\+(\d+)', main_window_geo)
-                            if geo_match:
-                                # Position popup to the right of the main window
-                                popup_x = main_x + main_width + 10
-                                popup_y = main_y
-                                qr_popup.geometry(f"+{popup_x}+{popup_y}")
+                            # Position popup to the right of the main window
+                            popup_x = main_x + main_width + 10
+                            popup_y = main_y
+                            qr_popup.geometry(f"+{popup_x}+{popup_y}")
 
                             # Frame to organize content
                             content_frame = ttk.Frame(qr_popup)
@@ -1489,18 +1484,14 @@ class UI:
                             qr_popup.resizable(False, False)
 
                             # Position the popup next to the main window
-                            main_window_geo = self.geometry()
                             main_x = self.winfo_x()
                             main_y = self.winfo_y()
                             main_width = self.winfo_width()
 
-                            # Parse main window geometry
-                            geo_match = re.match(r'(\d+)x(\d+)\+(\d+)\+(\d+)', main_window_geo)
-                            if geo_match:
-                                # Position popup to the right of the main window
-                                popup_x = main_x + main_width + 10
-                                popup_y = main_y
-                                qr_popup.geometry(f"+{popup_x}+{popup_y}")
+                            # Position popup to the right of the main window
+                            popup_x = main_x + main_width + 10
+                            popup_y = main_y
+                            qr_popup.geometry(f"+{popup_x}+{popup_y}")
 
                             # Frame to organize content
                             content_frame = ttk.Frame(qr_popup)
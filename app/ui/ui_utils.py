@@ -1,5 +1,91 @@
+import os
+import re
 from contextlib import contextmanager
 
+from utils.settings import Settings
+
+# Most lines kept in the conversation and output log; older lines (at the bottom) are dropped
+MAX_LINES = 500
+
+# Last parsed settings file and the modification time it was parsed at
+_settings_cache = {'path': None, 'mtime': None, 'data': None}
+
+
+def _settings_mtime():
+    try:
+        return os.stat(_settings_cache['path']).st_mtime_ns
+    except OSError:
+        # No settings file yet
+        return None
+
+
+def _cached_settings() -> dict[str, str]:
+    """
+    Settings file contents, shared by the UI windows. The file is only parsed again when its modification time
+    changes; call _invalidate_cached_settings() after saving to the settings file.
+    """
+    if _settings_cache['data'] is not None and _settings_mtime() == _settings_cache['mtime']:
+        return _settings_cache['data']
+
+    settings = Settings()
+    _settings_cache['path'] = settings.settings_file_path
+    _settings_cache['mtime'] = _settings_mtime()
+    _settings_cache['data'] = settings.get_dict()
+    return _settings_cache['data']
+
+
+def _invalidate_cached_settings() -> None:
+    _settings_cache['data'] = None
+
+
+def phrase_trie_pattern(phrases) -> str:
+    """
+    Regex matching any of the phrases, with common prefixes factored out into a trie so the regex engine follows
+    one branch per character instead of trying every phrase at each position (an Aho-Corasick-like single pass
+    without an extra dependency). Phrases that contain another phrase can never change the result and are dropped.
+    """
+    phrases = [p for p in phrases if not any(o != p and o in p for o in phrases)]
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+
+def trim_text_lines(text_widget, max_lines: int = MAX_LINES) -> None:
+    """
+    Drop the lines past max_lines from the bottom of a text widget, so inserting at the top doesn't get slower as the
+    widget grows.
+
+    :param text_widget: Tkinter text widget to trim
+    :param max_lines: Number of lines to keep
+    """
+    line_count = int(text_widget.index('end-1c').split('.')[0])
+    if line_count > max_lines:
+        text_widget.delete(f'{max_lines + 1}.0', 'end')
+
+
+def set_label_text(label, text: str) -> None:
+    """
+    Set a label's text, skipping the configure (and relayout) when it already shows that text.
+
+    :param label: Tkinter label to update
+    :param text: Text to show
+    """
+    if label.cget('text') != text:
+        label.configure(text=text)
+
+
 @contextmanager
 def text_widget_editable(text_widget):
     """
@@ -11,4 +97,41 @@ def text_widget_editable(text_widget):
         text_widget.configure(state='normal')
         yield text_widget
     finally:
-        text_widget.configure(state='disabled')
\ No newline at end of file
+        text_widget.configure(state='disabled')
+
+
+# Control (0x4) and Mod1 (0x8): Command on macOS, Alt on X11
+_SHORTCUT_MODIFIERS = 0x4 | 0x8
+
+# Shortcuts that only read from a text widget (copy, select all)
+_READ_ONLY_SHORTCUTS = frozenset({'c', 'C', 'a', 'A', 'Insert'})
+
+# Non-printable keys that edit a text widget
+_EDIT_KEYSYMS = frozenset({'BackSpace', 'Delete', 'Return', 'KP_Enter', 'Tab', 'Insert'})
+
+
+def _block_edit_key(event):
+    if event.state & _SHORTCUT_MODIFIERS:
+        if event.keysym in _READ_ONLY_SHORTCUTS:
+            return None
+        # Letter shortcuts (paste, cut, Emacs-style deletes) and modified editing keys
+        if len(event.keysym) == 1 or event.keysym in _EDIT_KEYSYMS:
+            return 'break'
+        return None  # Navigation such as Control+Home
+    if (event.char and event.char.isprintable()) or event.keysym in _EDIT_KEYSYMS:
+        return 'break'
+    # Arrows, Home/End, PageUp/PageDown and their Shift selections
+    return None
+
+
+def make_read_only(text_widget):
+    """
+    Make a text widget read-only for the user while leaving it in the 'normal' state, so the program can insert
+    and delete without toggling the state around every write. Copy and select all (with Control or Command) and the
+    navigation keys keep working.
+
+    :param text_widget: Tkinter text widget to manage
+    """
+    text_widget.bind('<Key>', _block_edit_key)
+    for sequence in ('<<Paste>>', '<<Cut>>', '<<PasteSelection>>', '<<Clear>>'):
+        text_widget.bind(sequence, lambda event: 'break')
@@ -0,0 +1,191 @@
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from queue import SimpleQueue
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../app')))
+
+import interpreter
+from interpreter import Interpreter
+
+
+class FakePyautogui:
+    """
+    Records the pyautogui calls made by the interpreter instead of driving the mouse and keyboard.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def click(self, *args, **kwargs):
+        self.calls.append(('click', args, kwargs))
+
+    def press(self, *args, **kwargs):
+        self.calls.append(('press', args, kwargs))
+
+    def write(self, *args, **kwargs):
+        self.calls.append(('write', args, kwargs))
+
+    def hotkey(self, *args, **kwargs):
+        self.calls.append(('hotkey', args, kwargs))
+
+
+class InterpreterTestCase(unittest.TestCase):
+    pyautogui = None
+
+    def setUp(self):
+        # The interpreter logs skipped and failed commands, which these tests do on purpose
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+        # Settings live under ~/.open-interface/, point the home directory at a scratch one
+        home = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        patcher = mock.patch.dict(os.environ, {'HOME': home.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(interpreter, 'pyautogui', self.pyautogui)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.status_queue = SimpleQueue()
+        self.interpreter = Interpreter(self.status_queue)
+        self.addCleanup(self.interpreter.cleanup)
+
+
+class DispatchTest(InterpreterTestCase):
+    def setUp(self):
+        self.pyautogui = FakePyautogui()
+        super().setUp()
+
+    def test_pyautogui_functions_get_the_parameters_as_keywords(self):
+        self.interpreter.execute_function('click', {'x': 10, 'y': 20})
+        self.assertEqual(self.pyautogui.calls[-1], ('click', (), {'x': 10, 'y': 20}))
+
+    def test_warms_up_pyautogui_once(self):
+        self.interpreter.execute_function('click', {})
+        self.interpreter.execute_function('click', {})
+        warm_ups = [call for call in self.pyautogui.calls if call[0] == 'press']
+        self.assertEqual(warm_ups, [('press', ('command',), {'interval': 0.2})])
+
+    def test_unknown_function_is_skipped(self):
+        self.interpreter.execute_function('no_such_function', {'x': 1})
+        self.assertNotIn('no_such_function', [call[0] for call in self.pyautogui.calls])
+
+    def test_process_command_reports_the_justification(self):
+        command = {'function': 'click', 'parameters': {}, 'human_readable_justification': 'Clicking the button'}
+        self.assertTrue(self.interpreter.process_command(command))
+        self.assertEqual(self.status_queue.get_nowait(), 'Clicking the button')
+
+    def test_process_command_fails_on_bad_parameters(self):
+        command = {'function': 'sleep', 'parameters': {'secs': 'soon'}}
+        self.assertFalse(self.interpreter.process_command(command))
+
+
+class ParameterNormalizationTest(InterpreterTestCase):
+    def setUp(self):
+        self.pyautogui = FakePyautogui()
+        super().setUp()
+        # Leave out the warm-up key press
+        self.interpreter._warmed_up = True
+
+    def test_press_takes_the_whole_key_sequence_in_one_call(self):
+        self.interpreter.execute_function('press', {'keys': ['ctrl', 'l'], 'interval': 0.1})
+        self.assertEqual(self.pyautogui.calls, [('press', (['ctrl', 'l'],), {'presses': 1, 'interval': 0.1})])
+
+    def test_press_wraps_a_single_key(self):
+        self.interpreter.execute_function('press', {'key': 'enter', 'presses': 2})
+        self.assertEqual(self.pyautogui.calls, [('press', (['enter'],), {'presses': 2, 'interval': 0.0})])
+
+    def test_press_passes_other_parameters_through(self):
+        self.interpreter.execute_function('press', {'keys_to_press': 'enter'})
+        self.assertEqual(self.pyautogui.calls, [('press', (), {'keys_to_press': 'enter'})])
+
+    def test_write_accepts_text_for_string(self):
+        self.interpreter.execute_function('write', {'text': 'hello'})
+        self.assertEqual(self.pyautogui.calls, [('write', ('hello',), {'interval': 0.1})])
+
+    def test_hotkey_unpacks_keys(self):
+        self.interpreter.execute_function('hotkey', {'keys': ['command', 'space']})
+        self.assertEqual(self.pyautogui.calls, [('hotkey', ('command', 'space'), {})])
+
+
+class ProcessCommandsTest(InterpreterTestCase):
+    def setUp(self):
+        self.pyautogui = FakePyautogui()
+        super().setUp()
+        self.interpreter._warmed_up = True
+
+        # Launches record themselves next to the pyautogui calls instead of opening anything
+        lock = threading.Lock()
+
+        def launch(parameters):
+            time.sleep(0.05)
+            with lock:
+                self.pyautogui.calls.append(('open_url', parameters['url']))
+
+        self.interpreter._dispatch['open_url'] = launch
+
+    def test_launches_finish_before_the_next_gui_step(self):
+        commands = [
+            {'function': 'open_url', 'parameters': {'url': 'a'}},
+            {'function': 'open_url', 'parameters': {'url': 'b'}},
+            {'function': 'click', 'parameters': {}},
+        ]
+        self.assertTrue(self.interpreter.process_commands(commands))
+        self.assertEqual(sorted(self.pyautogui.calls[:2]), [('open_url', 'a'), ('open_url', 'b')])
+        self.assertEqual(self.pyautogui.calls[2:], [('click', (), {})])
+
+    def test_trailing_launches_are_waited_for(self):
+        commands = [{'function': 'open_url', 'parameters': {'url': 'a'}}]
+        self.assertTrue(self.interpreter.process_commands(commands))
+        self.assertEqual(self.pyautogui.calls, [('open_url', 'a')])
+
+    def test_stops_before_the_next_command(self):
+        commands = [{'function': 'click', 'parameters': {}}] * 3
+        checks = iter([False, True])
+        self.assertFalse(self.interpreter.process_commands(commands, should_stop=lambda: next(checks)))
+        self.assertEqual(len(self.pyautogui.calls), 1)
+
+    def test_a_failing_step_ends_the_plan(self):
+        commands = [
+            {'function': 'sleep', 'parameters': {'secs': 'soon'}},
+            {'function': 'click', 'parameters': {}},
+        ]
+        self.assertFalse(self.interpreter.process_commands(commands))
+        self.assertEqual(self.pyautogui.calls, [])
+
+
+class OpenApplicationTest(InterpreterTestCase):
+    def open_application(self, app_name):
+        with mock.patch.object(interpreter.subprocess, 'Popen') as popen:
+            self.interpreter.open_application(app_name)
+        return popen.call_args
+
+    def test_plain_words_are_executed_directly(self):
+        args, kwargs = self.open_application('gnome-calculator --mode=basic')
+        self.assertEqual(args, (['gnome-calculator', '--mode=basic'],))
+        self.assertNotIn('shell', kwargs)
+
+    def test_shell_syntax_goes_through_the_shell(self):
+        for app_name in ('code ~/proj', 'open -a Foo && sleep 1', '$EDITOR x', "open -a 'Visual Studio Code'"):
+            args, kwargs = self.open_application(app_name)
+            self.assertEqual((args, kwargs), ((app_name,), {'shell': True}), app_name)
+
+
+class HeadlessDispatchTest(InterpreterTestCase):
+    def test_gui_functions_are_skipped_without_a_status(self):
+        self.assertTrue(self.interpreter.headless_mode)
+        command = {'function': 'click', 'parameters': {}, 'human_readable_justification': 'Clicking the button'}
+        self.assertTrue(self.interpreter.process_command(command))
+        self.assertTrue(self.status_queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../app')))
+
+from ui import ui_utils
+from ui.ui_utils import (_block_edit_key, _cached_settings, _invalidate_cached_settings, phrase_trie_pattern,
+                         trim_text_lines)
+from utils.settings import Settings
+
+
+def plain_alternation(phrases) -> re.Pattern:
+    return re.compile('|'.join(map(re.escape, phrases)), re.IGNORECASE)
+
+
+class PhraseTriePatternTest(unittest.TestCase):
+    def assert_same_matches(self, phrases, texts):
+        trie_re = re.compile(phrase_trie_pattern(phrases), re.IGNORECASE)
+        plain_re = plain_alternation(phrases)
+        for text in texts:
+            self.assertEqual(bool(trie_re.search(text)), bool(plain_re.search(text)), (phrases, text))
+
+    def test_matches_like_plain_alternation_on_random_phrases(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            phrases = [''.join(rng.choice('ab .') for _ in range(rng.randint(1, 5)))
+                       for _ in range(rng.randint(1, 6))]
+            texts = [''.join(rng.choice('abAB .c') for _ in range(rng.randint(0, 12))) for _ in range(30)]
+            self.assert_same_matches(phrases, texts)
+
+    def test_shared_prefixes_and_nested_phrases(self):
+        phrases = ['user said', 'user sent', 'user requested', 'the user request', 'waiting', 'waiting for']
+        texts = ['The USER SENT a request', 'user se', 'still waiting', 'waitin', 'the user requests more', '']
+        self.assert_same_matches(phrases, texts)
+
+    def test_filtered_phrases_of_main_window(self):
+        try:
+            from ui import main_window
+        except ImportError as e:
+            self.skipTest(f'main_window is not importable: {e}')
+
+        texts = [f'Status: {phrase.upper()} now' for phrase in main_window._FILTERED_PHRASES]
+        texts += ['Here is the weather for today', 'Opened the browser', '']
+        plain_re = plain_alternation(main_window._FILTERED_PHRASES)
+        for text in texts:
+            self.assertEqual(bool(main_window._FILTERED_RE.search(text)), bool(plain_re.search(text)), text)
+
+
+class FakeText:
+    """
+    The part of a Tk text widget that trim_text_lines uses, over a list of lines.
+    """
+
+    def __init__(self, lines):
+        self.lines = list(lines)
+
+    def index(self, index):
+        assert index == 'end-1c'
+        return f'{len(self.lines)}.{len(self.lines[-1])}'
+
+    def delete(self, start, end):
+        assert end == 'end'
+        line = int(start.split('.')[0])
+        # Deleting from the start of a line also removes the newline that ends the line before it
+        self.lines = self.lines[:line - 1]
+
+
+class TrimTextLinesTest(unittest.TestCase):
+    def test_drops_lines_past_the_cap_from_the_bottom(self):
+        text = FakeText([f'line {n}' for n in range(1, 11)])
+        trim_text_lines(text, max_lines=4)
+        self.assertEqual(text.lines, ['line 1', 'line 2', 'line 3', 'line 4'])
+
+    def test_leaves_short_text_alone(self):
+        text = FakeText(['line 1', 'line 2'])
+        trim_text_lines(text, max_lines=2)
+        self.assertEqual(text.lines, ['line 1', 'line 2'])
+
+
+class CachedSettingsTest(unittest.TestCase):
+    def setUp(self):
+        # Settings live under ~/.open-interface/, point the home directory at a scratch one
+        home = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        patcher = mock.patch.dict(os.environ, {'HOME': home.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        cache = mock.patch.dict(ui_utils._settings_cache, {'path': None, 'mtime': None, 'data': None})
+        cache.start()
+        self.addCleanup(cache.stop)
+
+        self.settings_path = Settings().settings_file_path
+
+    def write_settings(self, settings, mtime_ns):
+        with open(self.settings_path, 'w') as file:
+            json.dump(settings, file)
+        os.utime(self.settings_path, ns=(mtime_ns, mtime_ns))
+
+    def test_reuses_the_parsed_settings_while_the_file_is_unchanged(self):
+        self.write_settings({'theme': 'darkly'}, 1_000_000_000)
+        settings = _cached_settings()
+        self.assertEqual(settings, {'theme': 'darkly'})
+        self.assertIs(_cached_settings(), settings)
+
+    def test_rereads_the_file_when_its_mtime_changes(self):
+        self.write_settings({'theme': 'darkly'}, 1_000_000_000)
+        self.assertEqual(_cached_settings(), {'theme': 'darkly'})
+
+        self.write_settings({'theme': 'solar'}, 2_000_000_000)
+        self.assertEqual(_cached_settings(), {'theme': 'solar'})
+
+    def test_rereads_the_file_after_invalidation(self):
+        self.write_settings({'theme': 'darkly'}, 1_000_000_000)
+        self.assertEqual(_cached_settings(), {'theme': 'darkly'})
+
+        # Same mtime as before, so only the explicit invalidation can pick up the new contents
+        self.write_settings({'theme': 'solar'}, 1_000_000_000)
+        _invalidate_cached_settings()
+        self.assertEqual(_cached_settings(), {'theme': 'solar'})
+
+    def test_missing_settings_file(self):
+        self.assertEqual(_cached_settings(), {})
+        self.write_settings({'theme': 'solar'}, 1_000_000_000)
+        self.assertEqual(_cached_settings(), {'theme': 'solar'})
+
+
+def key(keysym, char='', state=0):
+    return SimpleNamespace(keysym=keysym, char=char, state=state)
+
+
+CONTROL = 0x4
+COMMAND = 0x8
+SHIFT = 0x1
+
+
+class BlockEditKeyTest(unittest.TestCase):
+    def test_blocks_typing_and_editing_keys(self):
+        for event in (key('a', 'a'), key('A', 'A', SHIFT), key('space', ' '), key('BackSpace', '\b'),
+                      key('Delete', '\x7f'), key('Return', '\r'), key('Tab', '\t'), key('Insert', state=SHIFT)):
+            self.assertEqual(_block_edit_key(event), 'break', event)
+
+    def test_blocks_editing_shortcuts(self):
+        for event in (key('v', '\x16', CONTROL), key('x', '\x18', CONTROL), key('v', 'v', COMMAND),
+                      key('d', '\x04', CONTROL), key('BackSpace', '\b', COMMAND)):
+            self.assertEqual(_block_edit_key(event), 'break', event)
+
+    def test_allows_copy_and_select_all_with_control_or_command(self):
+        for event in (key('c', '\x03', CONTROL), key('a', '\x01', CONTROL), key('c', 'c', COMMAND),
+                      key('a', 'a', COMMAND), key('Insert', state=CONTROL)):
+            self.assertIsNone(_block_edit_key(event), event)
+
+    def test_allows_navigation_and_selection(self):
+        for event in (key('Left'), key('Down', state=SHIFT), key('Home'), key('End', state=CONTROL),
+                      key('Prior'), key('Next'), key('Shift_L', state=SHIFT), key('Escape', '\x1b')):
+            self.assertIsNone(_block_edit_key(event), event)
+
+
+if __name__ == '__main__':
+    unittest.main()